@@ -0,0 +1,113 @@
+"""
+Example payloads for the neural data schemas.
+
+These used to live in each model's ``json_schema_extra``. They are kept
+here so the runtime models stay lean; import this module only where
+examples are needed (documentation, OpenAPI generation).
+"""
+
+from typing import Dict, Type
+
+from pydantic import BaseModel
+
+from schema import (
+    CycleData,
+    Message,
+    RedisMessageData,
+    SessionInfo,
+    SessionData,
+)
+
+CYCLE_DATA_EXAMPLE = {
+    "v": 1.2,
+    "t": 5000.5,
+    "pred": [1000.2, 2000.1],
+    "gt": [1000.0, 2000.0]
+}
+
+MESSAGE_EXAMPLE = {
+    "cycles": [
+        {
+            "v": 1.2,
+            "t": 5000.5,
+            "pred": [1000.2],
+            "gt": [1000.0]
+        }
+    ]
+}
+
+REDIS_MESSAGE_DATA_EXAMPLE = {
+    "message_id": 1,
+    "received_at": "2025-11-21T12:34:56.789123",
+    "data": {
+        "cycles": [
+            {
+                "v": 1.2,
+                "t": 5000.5,
+                "pred": [1000.2],
+                "gt": [1000.0]
+            }
+        ]
+    }
+}
+
+SESSION_INFO_EXAMPLE = {
+    "client_ip": "192.168.1.100",
+    "client_port": 54321,
+    "start_time": "2025-11-21T12:34:00",
+    "end_time": "2025-11-21T12:35:30",
+    "total_messages": 100,
+    "total_cycles": 500,
+    "duration_seconds": 90.0
+}
+
+SESSION_DATA_EXAMPLE = {
+    "session_info": {
+        "client_ip": "192.168.1.100",
+        "client_port": 54321,
+        "start_time": "2025-11-21T12:34:00",
+        "end_time": "2025-11-21T12:35:30",
+        "total_messages": 1,
+        "total_cycles": 1,
+        "duration_seconds": 90.0
+    },
+    "messages": [
+        {
+            "message_id": 1,
+            "received_at": "2025-11-21T12:34:05.123456",
+            "data": {
+                "cycles": [
+                    {
+                        "v": 1.2,
+                        "t": 5000.5,
+                        "pred": [1000.2],
+                        "gt": [1000.0]
+                    }
+                ]
+            }
+        }
+    ]
+}
+
+EXAMPLES: Dict[Type[BaseModel], Dict] = {
+    CycleData: CYCLE_DATA_EXAMPLE,
+    Message: MESSAGE_EXAMPLE,
+    RedisMessageData: REDIS_MESSAGE_DATA_EXAMPLE,
+    SessionInfo: SESSION_INFO_EXAMPLE,
+    SessionData: SESSION_DATA_EXAMPLE,
+}
+
+
+def json_schema_with_example(model: Type[BaseModel]) -> Dict:
+    """
+    Build the JSON schema for a model with its example attached.
+
+    Args:
+        model: One of the schema classes
+
+    Returns:
+        JSON schema dictionary including an "example" key
+    """
+    schema = model.model_json_schema()
+    schema["example"] = EXAMPLES[model]
+    return schema
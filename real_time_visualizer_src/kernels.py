@@ -0,0 +1,37 @@
+"""
+Numeric kernels for neural data statistics.
+
+Kept in their own module so validators.py can be compiled ahead of time
+(see setup.py) while these functions stay plain Python for numba to JIT.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy reductions
+    njit = None  # type: ignore[assignment]
+
+
+if njit is not None:
+    # Only reassociation/contraction: the full fastmath set includes 'nnan',
+    # which would let LLVM drop the NaN check on unvalidated input
+    @njit(cache=True, fastmath={'reassoc', 'contract'})
+    def voltage_stats(v):
+        """Fused min/max/mean over a non-empty 1-D array in a single pass."""
+        vmin = v[0]
+        vmax = v[0]
+        s = 0.0
+        for i in range(v.shape[0]):
+            x = v[i]
+            if x != x:
+                # NaN propagates to all three results, as with NumPy
+                return x, x, x
+            s += x
+            if x < vmin:
+                vmin = x
+            if x > vmax:
+                vmax = x
+        return vmin, vmax, s / v.shape[0]
+else:
+    def voltage_stats(v):
+        """Min/max/mean over a non-empty 1-D array."""
+        return v.min(), v.max(), v.mean()
@@ -6,11 +6,27 @@ This module defines schemas for:
 2. Complete messages with multiple cycles
 3. Redis queue message format
 4. Session information and summary
+5. A columnar (structure-of-arrays) view of many cycles
 """
 
-from pydantic import BaseModel, Field
+from itertools import chain
+from operator import attrgetter
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
+
+
+# Shared by all models. Nested model instances that are already validated
+# (e.g. RedisMessageData passed into SessionData) are kept as-is instead of
+# being copied and re-walked down to every cycle.
+_MODEL_CONFIG = ConfigDict(
+    revalidate_instances='never',
+    validate_assignment=False,
+    extra='ignore',
+    arbitrary_types_allowed=False,
+)
 
 
 class CycleData(BaseModel):
@@ -22,20 +38,99 @@ class CycleData(BaseModel):
         pred: List of predicted spike times in microseconds (List[float])
         gt: List of ground truth spike times in microseconds (List[float])
     """
+    model_config = _MODEL_CONFIG
+
     v: float = Field(..., description="Voltage reading in volts (can be negative)", le=3.0)
     t: Optional[float] = Field(None, description="Time measurement in microseconds", ge=0.0)
     pred: List[float] = Field(default_factory=list, description="Predicted spike times (μs)")
     gt: List[float] = Field(default_factory=list, description="Ground truth spike times (μs)")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "v": 1.2,
-                "t": 5000.5,
-                "pred": [1000.2, 2000.1],
-                "gt": [1000.0, 2000.0]
-            }
-        }
+
+_get_v = attrgetter('v')
+_get_t = attrgetter('t')
+_get_pred = attrgetter('pred')
+_get_gt = attrgetter('gt')
+
+
+def _to_csr(lists: List[List[float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Pack ragged lists into (offsets, values) arrays, CSR style."""
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, lists), dtype=np.int64, count=len(lists)), out=offsets[1:])
+    values = np.fromiter(chain.from_iterable(lists), dtype=np.float64, count=int(offsets[-1]))
+    return offsets, values
+
+
+class CycleBatch:
+    """Structure-of-arrays view of a sequence of cycles.
+
+    Scalar fields are stored as dense arrays and the ragged spike lists
+    in CSR form: the spikes of cycle i are values[offsets[i]:offsets[i+1]].
+
+    Attributes:
+        v: Voltage readings (float64)
+        t: Time measurements (float64, NaN where the cycle had no time)
+        pred_offsets: Offsets into pred_values, length len(batch) + 1
+            (None if the batch was built with include_pred=False)
+        pred_values: Concatenated predicted spike times (or None)
+        gt_offsets: Offsets into gt_values, length len(batch) + 1
+        gt_values: Concatenated ground truth spike times
+    """
+    __slots__ = ('v', 't', 'pred_offsets', 'pred_values', 'gt_offsets', 'gt_values')
+
+    def __init__(self, v, t, pred_offsets, pred_values, gt_offsets, gt_values):
+        self.v = v
+        self.t = t
+        self.pred_offsets = pred_offsets
+        self.pred_values = pred_values
+        self.gt_offsets = gt_offsets
+        self.gt_values = gt_values
+
+    def __len__(self) -> int:
+        return self.v.shape[0]
+
+    @classmethod
+    def from_cycles(cls, cycles: Iterable[CycleData], include_pred: bool = True) -> "CycleBatch":
+        """Build a batch from CycleData objects.
+
+        Pass include_pred=False when only v, t and gt are needed (e.g. for
+        statistics) to skip packing the predicted spike lists.
+        """
+        cycles = cycles if isinstance(cycles, list) else list(cycles)
+        n = len(cycles)
+        pred_offsets = pred_values = None
+        if include_pred:
+            pred_offsets, pred_values = _to_csr(list(map(_get_pred, cycles)))
+        gt_offsets, gt_values = _to_csr(list(map(_get_gt, cycles)))
+        return cls(
+            v=np.fromiter(map(_get_v, cycles), dtype=np.float64, count=n),
+            # None becomes NaN when converted to a float array
+            t=np.array(list(map(_get_t, cycles)), dtype=np.float64),
+            pred_offsets=pred_offsets,
+            pred_values=pred_values,
+            gt_offsets=gt_offsets,
+            gt_values=gt_values,
+        )
+
+    def to_cycles(self) -> List[CycleData]:
+        """Convert the batch back to CycleData objects (pred is empty if not packed)."""
+        n = len(self)
+        if self.pred_values is not None:
+            pred = self.pred_values.tolist()
+            po = self.pred_offsets.tolist()
+        else:
+            pred = []
+            po = [0] * (n + 1)
+        gt = self.gt_values.tolist()
+        go = self.gt_offsets.tolist()
+        return [
+            CycleData.model_construct(
+                v=v,
+                t=None if t != t else t,
+                pred=pred[po[i]:po[i + 1]],
+                gt=gt[go[i]:go[i + 1]],
+            )
+            for i, (v, t) in enumerate(zip(self.v.tolist(), self.t.tolist()))
+        ]
 
 
 class Message(BaseModel):
@@ -44,21 +139,13 @@ class Message(BaseModel):
     Attributes:
         cycles: List of cycle data points
     """
+    model_config = _MODEL_CONFIG
+
     cycles: List[CycleData] = Field(..., description="List of cycles in this message")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "cycles": [
-                    {
-                        "v": 1.2,
-                        "t": 5000.5,
-                        "pred": [1000.2],
-                        "gt": [1000.0]
-                    }
-                ]
-            }
-        }
+    def to_batch(self) -> CycleBatch:
+        """Return the cycles of this message as a CycleBatch."""
+        return CycleBatch.from_cycles(self.cycles)
 
 
 class RedisMessageData(BaseModel):
@@ -72,28 +159,12 @@ class RedisMessageData(BaseModel):
         received_at: ISO format timestamp when message was received
         data: The actual message containing cycle data
     """
+    model_config = _MODEL_CONFIG
+
     message_id: int = Field(..., description="Sequential message ID", ge=1)
     received_at: datetime = Field(..., description="When message was received (ISO format)")
     data: Message = Field(..., description="The message data containing cycles")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "message_id": 1,
-                "received_at": "2025-11-21T12:34:56.789123",
-                "data": {
-                    "cycles": [
-                        {
-                            "v": 1.2,
-                            "t": 5000.5,
-                            "pred": [1000.2],
-                            "gt": [1000.0]
-                        }
-                    ]
-                }
-            }
-        }
-
 
 class SessionInfo(BaseModel):
     """Schema for session metadata.
@@ -107,6 +178,8 @@ class SessionInfo(BaseModel):
         total_cycles: Total cycles processed in session (optional)
         duration_seconds: Session duration in seconds (optional)
     """
+    model_config = _MODEL_CONFIG
+
     client_ip: str = Field(..., description="ESP32 client IP address")
     client_port: int = Field(..., description="ESP32 client port number", ge=0, le=65535)
     start_time: datetime = Field(..., description="Session start time (ISO format)")
@@ -115,19 +188,6 @@ class SessionInfo(BaseModel):
     total_cycles: Optional[int] = Field(None, description="Total cycles processed", ge=0)
     duration_seconds: Optional[float] = Field(None, description="Session duration in seconds", ge=0)
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "client_ip": "192.168.1.100",
-                "client_port": 54321,
-                "start_time": "2025-11-21T12:34:00",
-                "end_time": "2025-11-21T12:35:30",
-                "total_messages": 100,
-                "total_cycles": 500,
-                "duration_seconds": 90.0
-            }
-        }
-
 
 class SessionData(BaseModel):
     """Schema for complete session data saved to file.
@@ -139,37 +199,7 @@ class SessionData(BaseModel):
         session_info: Metadata about the session
         messages: List of all messages received during session
     """
+    model_config = _MODEL_CONFIG
+
     session_info: SessionInfo = Field(..., description="Session metadata")
     messages: List[RedisMessageData] = Field(..., description="All messages from session")
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "session_info": {
-                    "client_ip": "192.168.1.100",
-                    "client_port": 54321,
-                    "start_time": "2025-11-21T12:34:00",
-                    "end_time": "2025-11-21T12:35:30",
-                    "total_messages": 1,
-                    "total_cycles": 1,
-                    "duration_seconds": 90.0
-                },
-                "messages": [
-                    {
-                        "message_id": 1,
-                        "received_at": "2025-11-21T12:34:05.123456",
-                        "data": {
-                            "cycles": [
-                                {
-                                    "v": 1.2,
-                                    "t": 5000.5,
-                                    "pred": [1000.2],
-                                    "gt": [1000.0]
-                                }
-                            ]
-                        }
-                    }
-                ]
-            }
-        }
-
@@ -0,0 +1,19 @@
+"""
+Optional ahead-of-time compilation of validators.py with mypyc.
+
+Usage (from this directory):
+    pip install mypy
+    python setup.py build_ext --inplace
+
+This places a compiled extension next to validators.py, which Python then
+imports in preference to the source file. No code changes are needed in
+importers; delete the generated .so file to go back to pure Python.
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="real_time_visualizer_validators",
+    ext_modules=mypycify(["validators.py"]),
+)
@@ -5,28 +5,114 @@ This module provides helper functions for validating and working with
 neural data structures using Pydantic schemas.
 """
 
-import json
 import logging
-from typing import Dict, Optional, List, Tuple
+import os
+from typing import Any, Callable, Dict, NamedTuple, Optional, List, Tuple, Union
 from datetime import datetime
+from itertools import chain
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None  # type: ignore[assignment]
+    import json
+
+from kernels import voltage_stats
 from schema import (
+    CycleBatch,
     CycleData,
     Message,
     RedisMessageData,
     SessionInfo,
     SessionData,
 )
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Validators are compiled once at import time and reused for every call
+_CYCLE_ADAPTER = TypeAdapter(CycleData)
+_MSG_ADAPTER = TypeAdapter(Message)
+_RMSG_ADAPTER = TypeAdapter(RedisMessageData)
+_SESSION_INFO_ADAPTER = TypeAdapter(SessionInfo)
+_SESSION_ADAPTER = TypeAdapter(SessionData)
+_RMSG_LIST_ADAPTER = TypeAdapter(List[RedisMessageData])
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _orjson_default(obj: Any) -> Dict[str, Any]:
+    """Expose already-validated models to orjson as plain field mappings."""
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def validate_cycle_json(json_data: Union[str, bytes]) -> CycleData:
+    """Parse and validate a JSON cycle. Raises ValidationError if invalid."""
+    return _CYCLE_ADAPTER.validate_json(json_data)
+
+
+def validate_message_json(json_data: Union[str, bytes]) -> Message:
+    """Parse and validate a JSON message. Raises ValidationError if invalid."""
+    return _MSG_ADAPTER.validate_json(json_data)
+
+
+def validate_redis_message_json(json_data: Union[str, bytes]) -> RedisMessageData:
+    """Parse and validate a JSON Redis message. Raises ValidationError if invalid."""
+    return _RMSG_ADAPTER.validate_json(json_data)
+
+
+def validate_session_json(json_data: Union[str, bytes]) -> SessionData:
+    """Parse and validate a JSON session file. Raises ValidationError if invalid."""
+    return _SESSION_ADAPTER.validate_json(json_data)
+
+
+# Dispatch table for validate_json_string. Payloads carry no type tag on the
+# wire, so the caller's data_type selects the validator.
+_JSON_VALIDATORS: Dict[str, Callable[[Union[str, bytes]], BaseModel]] = {
+    "cycle": validate_cycle_json,
+    "message": validate_message_json,
+    "redis_message": validate_redis_message_json,
+    "session": validate_session_json,
+}
+
+# Set ENABLE_VALIDATION=0 when the producer is trusted to skip schema
+# validation on the inbound Redis path (see RedisDataHandler.fast_deserialize)
+ENABLE_VALIDATION = os.environ.get("ENABLE_VALIDATION", "1").lower() not in ("0", "false", "no")
+
+
+class MessageStats(NamedTuple):
+    """Statistics for a single message (see DataStats.get_message_stats)."""
+    message_id: int
+    cycle_count: int
+    voltage_min: float
+    voltage_max: float
+    voltage_mean: float
+    time_min: Optional[float]
+    time_max: Optional[float]
+    spike_count: int
+
+
+class SessionStats(NamedTuple):
+    """Statistics for a complete session (see DataStats.get_session_stats)."""
+    client_ip: str
+    message_count: int
+    cycle_count: int
+    duration_seconds: Optional[float]
+    voltage_min: Optional[float]
+    voltage_max: Optional[float]
+    voltage_mean: Optional[float]
+    total_spikes: int
+
 
 class DataValidator:
     """Utility class for validating neural data structures."""
 
+    __slots__ = ()
+
     @staticmethod
-    def validate_cycle_data(data: Dict) -> Tuple[bool, Optional[CycleData], Optional[str]]:
+    def validate_cycle_data(data: Dict) -> Tuple[bool, Optional[CycleData], Optional[ValidationError]]:
         """
         Validate cycle data.
         
@@ -34,18 +120,17 @@ class DataValidator:
             data: Dictionary containing cycle data
             
         Returns:
-            Tuple of (is_valid, CycleData object, error message)
+            Tuple of (is_valid, CycleData object, ValidationError)
         """
         try:
-            cycle = CycleData(**data)
+            cycle = _CYCLE_ADAPTER.validate_python(data)
             return True, cycle, None
         except ValidationError as e:
-            error_msg = f"Cycle validation failed: {e}"
-            logger.error(error_msg)
-            return False, None, error_msg
+            logger.debug("Cycle validation failed: %s", e)
+            return False, None, e
 
     @staticmethod
-    def validate_message(data: Dict) -> Tuple[bool, Optional[Message], Optional[str]]:
+    def validate_message(data: Dict) -> Tuple[bool, Optional[Message], Optional[ValidationError]]:
         """
         Validate message data.
         
@@ -53,66 +138,55 @@ class DataValidator:
             data: Dictionary containing message with cycles
             
         Returns:
-            Tuple of (is_valid, Message object, error message)
+            Tuple of (is_valid, Message object, ValidationError)
         """
         try:
-            message = Message(**data)
+            message = _MSG_ADAPTER.validate_python(data)
             return True, message, None
         except ValidationError as e:
-            error_msg = f"Message validation failed: {e}"
-            logger.error(error_msg)
-            return False, None, error_msg
+            logger.debug("Message validation failed: %s", e)
+            return False, None, e
 
     @staticmethod
-    def validate_redis_message(data: Dict) -> Tuple[bool, Optional[RedisMessageData], Optional[str]]:
+    def validate_redis_message(data: Dict) -> Tuple[bool, Optional[RedisMessageData], Optional[ValidationError]]:
         """
         Validate Redis message data.
         
         Args:
-            data: Dictionary containing redis message
+            data: Dictionary containing redis message (received_at may be
+                an ISO format string or a datetime)
             
         Returns:
-            Tuple of (is_valid, RedisMessageData object, error message)
+            Tuple of (is_valid, RedisMessageData object, ValidationError)
         """
         try:
-            # Handle string timestamps
-            if isinstance(data.get('received_at'), str):
-                data['received_at'] = datetime.fromisoformat(data['received_at'])
-            
-            redis_msg = RedisMessageData(**data)
+            redis_msg = _RMSG_ADAPTER.validate_python(data)
             return True, redis_msg, None
         except ValidationError as e:
-            error_msg = f"Redis message validation failed: {e}"
-            logger.error(error_msg)
-            return False, None, error_msg
+            logger.debug("Redis message validation failed: %s", e)
+            return False, None, e
 
     @staticmethod
-    def validate_session_info(data: Dict) -> Tuple[bool, Optional[SessionInfo], Optional[str]]:
+    def validate_session_info(data: Dict) -> Tuple[bool, Optional[SessionInfo], Optional[ValidationError]]:
         """
         Validate session info data.
         
         Args:
-            data: Dictionary containing session info
+            data: Dictionary containing session info (timestamps may be
+                ISO format strings or datetimes)
             
         Returns:
-            Tuple of (is_valid, SessionInfo object, error message)
+            Tuple of (is_valid, SessionInfo object, ValidationError)
         """
         try:
-            # Handle string timestamps
-            if isinstance(data.get('start_time'), str):
-                data['start_time'] = datetime.fromisoformat(data['start_time'])
-            if isinstance(data.get('end_time'), str):
-                data['end_time'] = datetime.fromisoformat(data['end_time'])
-            
-            session_info = SessionInfo(**data)
+            session_info = _SESSION_INFO_ADAPTER.validate_python(data)
             return True, session_info, None
         except ValidationError as e:
-            error_msg = f"Session info validation failed: {e}"
-            logger.error(error_msg)
-            return False, None, error_msg
+            logger.debug("Session info validation failed: %s", e)
+            return False, None, e
 
     @staticmethod
-    def validate_session_data(data: Dict) -> Tuple[bool, Optional[SessionData], Optional[str]]:
+    def validate_session_data(data: Dict) -> Tuple[bool, Optional[SessionData], Optional[ValidationError]]:
         """
         Validate complete session data.
         
@@ -120,55 +194,58 @@ class DataValidator:
             data: Dictionary containing complete session data
             
         Returns:
-            Tuple of (is_valid, SessionData object, error message)
+            Tuple of (is_valid, SessionData object, ValidationError)
         """
         try:
-            session_data = SessionData(**data)
+            session_data = _SESSION_ADAPTER.validate_python(data)
             return True, session_data, None
         except ValidationError as e:
-            error_msg = f"Session data validation failed: {e}"
-            logger.error(error_msg)
-            return False, None, error_msg
+            logger.debug("Session data validation failed: %s", e)
+            return False, None, e
 
     @staticmethod
-    def validate_json_string(json_str: str, data_type: str = "redis_message") -> Tuple[bool, Optional[object], Optional[str]]:
+    def validate_json_string(json_str: Union[str, bytes], data_type: str = "redis_message") -> Tuple[bool, Optional[object], Optional[Exception]]:
         """
         Validate JSON string and return parsed data.
+
+        Compatibility wrapper around the typed validate_*_json functions;
+        hot paths should call those directly.
         
         Args:
-            json_str: JSON string to validate
+            json_str: JSON string (or bytes) to validate
             data_type: Type of data ("cycle", "message", "redis_message", "session")
             
         Returns:
-            Tuple of (is_valid, parsed object, error message)
+            Tuple of (is_valid, parsed object, error). The error is the
+            ValidationError, or a ValueError for an unknown data_type.
         """
-        try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError as e:
-            error_msg = f"JSON decode error: {e}"
-            logger.error(error_msg)
-            return False, None, error_msg
-
-        validators = {
-            "cycle": DataValidator.validate_cycle_data,
-            "message": DataValidator.validate_message,
-            "redis_message": DataValidator.validate_redis_message,
-            "session": DataValidator.validate_session_data,
-        }
-
-        if data_type not in validators:
-            return False, None, f"Unknown data type: {data_type}"
+        validate = _JSON_VALIDATORS.get(data_type)
+        if validate is None:
+            return False, None, ValueError(f"Unknown data type: {data_type}")
 
-        return validators[data_type](data)
+        # Parse and validate in one pass; ISO timestamps are handled by pydantic-core
+        try:
+            parsed = validate(json_str)
+            return True, parsed, None
+        except ValidationError as e:
+            logger.debug("JSON validation failed (%s): %s", data_type, e)
+            return False, None, e
 
 
 class RedisDataHandler:
     """Helper class for working with Redis data."""
 
+    __slots__ = ()
+
     @staticmethod
     def serialize_message(message: RedisMessageData) -> str:
         """
         Serialize RedisMessageData to JSON string.
+
+        With orjson installed the output is equivalent JSON to
+        model_dump_json (same keys, order and values; it decodes to an equal
+        model) but not byte-identical: float formatting can differ, e.g.
+        orjson writes 1e20 where pydantic writes 1e+20.
         
         Args:
             message: RedisMessageData object
@@ -176,28 +253,105 @@ class RedisDataHandler:
         Returns:
             JSON string representation
         """
-        return message.model_dump_json()
+        if orjson is None:
+            return message.model_dump_json()
+        return orjson.dumps(
+            message,
+            default=_orjson_default,
+            # OPT_UTC_Z writes UTC as 'Z' like pydantic does, not '+00:00'
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z,
+        ).decode()
 
     @staticmethod
-    def deserialize_message(json_str: str) -> Optional[RedisMessageData]:
+    def deserialize_message(json_str: Union[str, bytes]) -> Optional[RedisMessageData]:
         """
         Deserialize JSON string to RedisMessageData.
-        
+
+        Parsing and validation happen in a single pass inside pydantic-core,
+        without building an intermediate dict via json.loads. When
+        ENABLE_VALIDATION is off, this delegates to fast_deserialize.
+
         Args:
-            json_str: JSON string to deserialize
-            
+            json_str: JSON string (or bytes) to deserialize
+
         Returns:
             RedisMessageData object or None if invalid
         """
-        is_valid, message, error = DataValidator.validate_json_string(
-            json_str, data_type="redis_message"
-        )
-        return message if is_valid else None
+        if not ENABLE_VALIDATION:
+            return RedisDataHandler.fast_deserialize(json_str)
+
+        try:
+            return validate_redis_message_json(json_str)
+        except ValidationError as e:
+            # Keep the error-level line cheap; the full error tree is only
+            # rendered when debug logging is enabled
+            logger.error("Dropping invalid Redis message (%d validation errors)", e.error_count())
+            logger.debug("Redis message deserialization failed: %s", e)
+            return None
+
+    @staticmethod
+    def fast_deserialize(json_bytes: Union[bytes, str]) -> Optional[RedisMessageData]:
+        """
+        Deserialize a trusted JSON payload to RedisMessageData without validation.
+
+        Models are built with model_construct, so field constraints are not
+        checked. Only use this for data produced by this pipeline.
+
+        Args:
+            json_bytes: JSON bytes (or string) to deserialize
+
+        Returns:
+            RedisMessageData object or None if the payload is malformed
+        """
+        try:
+            d = _json_loads(json_bytes)
+            # No sys.intern pass on the keys: orjson caches short keys across
+            # calls and json memoizes them per document, so they already
+            # arrive as shared str objects with cached hashes
+            cycles = [CycleData.model_construct(**c) for c in d['data']['cycles']]
+            return RedisMessageData.model_construct(
+                message_id=d['message_id'],
+                received_at=datetime.fromisoformat(d['received_at']),
+                data=Message.model_construct(cycles=cycles),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error("Redis message fast deserialization failed: %s", e)
+            return None
+
+    @staticmethod
+    def deserialize_batch(json_list: List[Union[bytes, str]]) -> List[RedisMessageData]:
+        """
+        Deserialize a batch of JSON messages (e.g. from LRANGE/MGET) at once.
+
+        Each payload is parsed on its own, so it must hold exactly one JSON
+        value; a payload like ``{...},{...}`` is rejected rather than read as
+        two messages. The parsed batch is then validated in a single
+        pydantic-core call. If any payload is malformed or invalid, the batch
+        falls back to deserialize_message per payload so that only the bad
+        messages are dropped.
+
+        Args:
+            json_list: JSON strings (or bytes), one per message
+
+        Returns:
+            List of valid RedisMessageData objects, in input order
+        """
+        if ENABLE_VALIDATION:
+            try:
+                return _RMSG_LIST_ADAPTER.validate_python([_json_loads(b) for b in json_list])
+            except (ValueError, ValidationError):
+                pass
+        # deserialize_message delegates to fast_deserialize when validation is off
+        messages = [RedisDataHandler.deserialize_message(b) for b in json_list]
+        return [m for m in messages if m is not None]
 
     @staticmethod
     def serialize_session(session: SessionData) -> str:
         """
         Serialize SessionData to JSON string.
+
+        As with serialize_message, the orjson output is equivalent JSON to
+        model_dump_json(indent=2), not a byte-for-byte copy of it.
         
         Args:
             session: SessionData object
@@ -205,7 +359,13 @@ class RedisDataHandler:
         Returns:
             JSON string representation
         """
-        return session.model_dump_json(indent=2)
+        if orjson is None:
+            return session.model_dump_json(indent=2)
+        return orjson.dumps(
+            session,
+            default=_orjson_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z,
+        ).decode()
 
     @staticmethod
     def create_redis_message(
@@ -235,7 +395,7 @@ class RedisDataHandler:
 
         is_valid, message, error = DataValidator.validate_redis_message(data)
         if not is_valid:
-            logger.error(f"Failed to create Redis message: {error}")
+            logger.error("Failed to create Redis message: %s", error)
         return message
 
     @staticmethod
@@ -273,22 +433,31 @@ class RedisDataHandler:
             "duration_seconds": duration_seconds,
         }
 
+        is_valid, session_info, error = DataValidator.validate_session_info(session_info_data)
+        if not is_valid:
+            logger.error("Failed to create session data: %s", error)
+            return None
+
+        # Messages are already validated instances and are kept as-is
+        # (revalidate_instances='never'), so their cycles are not re-walked
         data = {
-            "session_info": session_info_data,
-            "messages": [msg.model_dump() for msg in messages]
+            "session_info": session_info,
+            "messages": messages
         }
 
         is_valid, session, error = DataValidator.validate_session_data(data)
         if not is_valid:
-            logger.error(f"Failed to create session data: {error}")
+            logger.error("Failed to create session data: %s", error)
         return session
 
 
 class DataStats:
     """Utility class for computing statistics on neural data."""
 
+    __slots__ = ()
+
     @staticmethod
-    def get_message_stats(message: RedisMessageData) -> Dict:
+    def get_message_stats(message: RedisMessageData) -> MessageStats:
         """
         Get statistics for a message.
         
@@ -296,25 +465,44 @@ class DataStats:
             message: RedisMessageData object
             
         Returns:
-            Dictionary with statistics
+            MessageStats tuple (use ._asdict() for a dictionary)
         """
         cycles = message.data.cycles
-        voltages = [c.v for c in cycles]
-        times = [c.t for c in cycles]
-
-        return {
-            "message_id": message.message_id,
-            "cycle_count": len(cycles),
-            "voltage_min": min(voltages),
-            "voltage_max": max(voltages),
-            "voltage_mean": sum(voltages) / len(voltages),
-            "time_min": min(times),
-            "time_max": max(times),
-            "spike_count": sum(len(c.gt) for c in cycles),
-        }
+
+        # Single pass over the cycles, no intermediate lists
+        vmin = vmax = cycles[0].v
+        vsum = 0.0
+        tmin = float('inf')
+        tmax = float('-inf')
+        spikes = 0
+        for c in cycles:
+            v = c.v
+            vsum += v
+            if v < vmin:
+                vmin = v
+            elif v > vmax:
+                vmax = v
+            t = c.t
+            if t is not None:
+                if t < tmin:
+                    tmin = t
+                if t > tmax:
+                    tmax = t
+            spikes += len(c.gt)
+
+        return MessageStats(
+            message_id=message.message_id,
+            cycle_count=len(cycles),
+            voltage_min=vmin,
+            voltage_max=vmax,
+            voltage_mean=vsum / len(cycles),
+            time_min=tmin if tmin <= tmax else None,
+            time_max=tmax if tmin <= tmax else None,
+            spike_count=spikes,
+        )
 
     @staticmethod
-    def get_session_stats(session: SessionData) -> Dict:
+    def get_session_stats(session: SessionData) -> SessionStats:
         """
         Get statistics for a complete session.
         
@@ -322,19 +510,27 @@ class DataStats:
             session: SessionData object
             
         Returns:
-            Dictionary with session statistics
+            SessionStats tuple (use ._asdict() for a dictionary)
         """
         info = session.session_info
-        all_cycles = [c for msg in session.messages for c in msg.data.cycles]
-        voltages = [c.v for c in all_cycles]
-
-        return {
-            "client_ip": info.client_ip,
-            "message_count": len(session.messages),
-            "cycle_count": len(all_cycles),
-            "duration_seconds": info.duration_seconds,
-            "voltage_min": min(voltages) if voltages else None,
-            "voltage_max": max(voltages) if voltages else None,
-            "voltage_mean": sum(voltages) / len(voltages) if voltages else None,
-            "total_spikes": sum(len(c.gt) for c in all_cycles),
-        }
+        # The stats never read pred, so its CSR arrays are not packed
+        batch = CycleBatch.from_cycles(
+            chain.from_iterable(msg.data.cycles for msg in session.messages),
+            include_pred=False,
+        )
+        n = len(batch)
+
+        vmin = vmax = vmean = None
+        if n:
+            vmin, vmax, vmean = (float(x) for x in voltage_stats(batch.v))
+
+        return SessionStats(
+            client_ip=info.client_ip,
+            message_count=len(session.messages),
+            cycle_count=n,
+            duration_seconds=info.duration_seconds,
+            voltage_min=vmin,
+            voltage_max=vmax,
+            voltage_mean=vmean,
+            total_spikes=int(batch.gt_offsets[-1]),
+        )
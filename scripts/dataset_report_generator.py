@@ -15,43 +15,239 @@ Usage:
 
 import json
 import argparse
+import logging
 import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from datetime import datetime
+from io import BytesIO
 from typing import Dict, List
 
+import matplotlib
+matplotlib.use('Agg')  # Headless report generation; must precede the pyplot import
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.patches import Patch
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; fall back to loading the whole file
+    ijson = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy masks
+    njit = None
+
+try:
+    import numexpr
+except ImportError:  # numexpr is optional; only used when numba is missing
+    numexpr = None
+
+logger = logging.getLogger(__name__)
+
 VOLTAGE_THRESHOLD_MAX = 2.1  # Voltage threshold to filter cycles
 VOLTAGE_THRESHOLD_MIN = 0.0
+FILTER_CHUNK_SIZE = 65536  # Cycles filtered per vectorized pass
+HEXBIN_MIN_POINTS = 50000  # Above this many points, draw density instead of scatter
+SAVE_DPI = 150  # Plots are embedded at ~7in wide in the PDF report
+SCATTER_MAX_POINTS = 20000  # Scatter layers are subsampled above this many points
 
-def get_dataset(dataset_path):
-    """Load a single dataset from a JSON file."""
-    with open(dataset_path, 'r') as f:
-        neural_data = json.load(f)
-    non_zero_gt_count = 0
-    doubles_count = 0
+# Per-cycle validity codes produced by classify_cycles, indexed into REASON_NAMES
+REASON_VALID = 0
+REASON_NO_SPIKES = 1
+REASON_NEGATIVE_TIME = 2
+REASON_V_TOO_HIGH = 3
+REASON_V_NEGATIVE = 4
+REASON_NAMES = (None, "no_spikes", "negative_time", "v_too_high", "v_negative")
+# Human-readable reason names for the PDF report
+REASON_LABELS = {name: name.replace('_', ' ').title() for name in REASON_NAMES[1:]}
+
+
+if njit is not None:
+    @njit(cache=True)
+    def classify_cycles(v, gt_time, gt_count, v_init):
+        """Return an int8 validity code per cycle; the first failing check wins."""
+        n = v.shape[0]
+        codes = np.zeros(n, dtype=np.int8)
+        for i in range(n):
+            if gt_count[i] == 0:
+                codes[i] = REASON_NO_SPIKES
+            elif gt_time[i] <= 0:
+                codes[i] = REASON_NEGATIVE_TIME
+            elif v[i] >= v_init:
+                codes[i] = REASON_V_TOO_HIGH
+            elif v[i] <= 0:
+                codes[i] = REASON_V_NEGATIVE
+        return codes
+else:
+    def classify_cycles(v, gt_time, gt_count, v_init):
+        """Return an int8 validity code per cycle; the first failing check wins."""
+        codes = np.zeros(v.shape[0], dtype=np.int8)
+        # Assign in reverse priority so earlier checks overwrite later ones
+        codes[v <= 0] = REASON_V_NEGATIVE
+        codes[v >= v_init] = REASON_V_TOO_HIGH
+        codes[gt_time <= 0] = REASON_NEGATIVE_TIME
+        codes[gt_count == 0] = REASON_NO_SPIKES
+        return codes
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def discharge_residuals(v, t, tau, v0):
+        """Return residuals of t (μs) against t = -tau*ln(v/v0) and their std."""
+        n = v.shape[0]
+        residuals = np.empty(n, dtype=np.float64)
+        total = 0.0
+        for i in range(n):
+            r = t[i] + tau * np.log(v[i] / v0) * 1e6
+            residuals[i] = r
+            total += r
+        mean = total / n
+        sq = 0.0
+        for i in range(n):
+            d = residuals[i] - mean
+            sq += d * d
+        return residuals, np.sqrt(sq / n)
+else:
+    def discharge_residuals(v, t, tau, v0):
+        """Return residuals of t (μs) against t = -tau*ln(v/v0) and their std."""
+        if numexpr is not None:
+            # One fused pass instead of NumPy's divide/log/scale/add temporaries
+            residuals = numexpr.evaluate("t + tau * log(v / v0) * 1e6")
+        else:
+            residuals = t + tau * np.log(v / v0) * 1e6
+        return residuals, residuals.std()
+
+
+def _no_messages_error(dataset_path):
+    """Build the error raised when a dataset file has no top-level 'messages' array."""
+    return ValueError(f"Malformed dataset {dataset_path}: no top-level 'messages' array")
+
+
+def _iter_cycles(dataset_path):
+    """
+    Yield every cycle dict in a dataset file, in file order.
     
-    dataset = []
-    for i, message in enumerate(neural_data['messages']):
-        cycles = message['data']['cycles']
-        for cycle in cycles:
-            if cycle.get('gt') and len(cycle['gt']) > 0 and float(cycle['v']) < VOLTAGE_THRESHOLD_MAX and float(cycle['v']) > VOLTAGE_THRESHOLD_MIN:
-                non_zero_gt_count += 1
-                dataset.append(cycle)
-                if len(cycle['gt']) > 1:
-                    doubles_count += 1
+    Raises:
+        ValueError: If the file has no top-level 'messages' array
+    """
+    if ijson is not None:
+        # Stream the cycles so only the ones we keep stay in memory
+        with open(dataset_path, 'rb') as f:
+            found = False
+            try:
+                for cycle in ijson.items(f, 'messages.item.data.cycles.item', use_float=True):
+                    found = True
+                    yield cycle
+                if not found:
+                    # No cycles may just mean empty messages; rescan to tell
+                    # that apart from a file with no messages array at all
+                    f.seek(0)
+                    if not any(prefix == 'messages' and event == 'start_array'
+                               for prefix, event, _ in ijson.parse(f)):
+                        raise _no_messages_error(dataset_path)
+            except ijson.JSONError as e:
+                raise json.JSONDecodeError(str(e), '', 0) from e
+        return
+
+    with open(dataset_path, 'rb') as f:
+        raw = f.read()
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    # keep catching the latter
+    neural_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    messages = neural_data.get('messages') if isinstance(neural_data, dict) else None
+    if not isinstance(messages, list):
+        raise _no_messages_error(dataset_path)
+    for message in messages:
+        yield from message['data']['cycles']
+
+
+def _filter_cycles(chunk):
+    """
+    Keep cycles with ground truth and a voltage inside the thresholds.
+    
+    Returns:
+        Columnar dataset of the kept cycles (see get_dataset)
+    """
+    n = len(chunk)
+    gt_len = np.fromiter((len(c.get('gt') or ()) for c in chunk), dtype=np.int64, count=n)
+    # Only cycles with ground truth have their voltage read, so cycles without
+    # gt may omit v (or carry null) and are still skipped silently
+    has_gt = np.flatnonzero(gt_len > 0)
+    v = np.fromiter((chunk[i]['v'] for i in has_gt), dtype=np.float64, count=len(has_gt))
+    in_range = (v < VOLTAGE_THRESHOLD_MAX) & (v > VOLTAGE_THRESHOLD_MIN)
+    keep = has_gt[in_range]
+    kept = [chunk[i] for i in keep]
+    gt_lists = [c['gt'] for c in kept]
+    return {
+        'v': v[in_range],
+        't': np.fromiter((c['t'] for c in kept), dtype=np.float64, count=len(kept)),
+        'gt_last': np.fromiter((g[-1] for g in gt_lists), dtype=np.float64, count=len(kept)),
+        'gt_len': gt_len[keep],
+        'gt_lists': gt_lists,
+    }
+
+
+def _concat_datasets(parts):
+    """Concatenate columnar datasets in order."""
+    if not parts:
+        return _filter_cycles([])
+    if len(parts) == 1:
+        return parts[0]
+    combined = {key: np.concatenate([p[key] for p in parts])
+                for key in ('v', 't', 'gt_last', 'gt_len')}
+    combined['gt_lists'] = [g for p in parts for g in p['gt_lists']]
+    return combined
+
+
+def _load_dataset(dataset_path):
+    """Load and filter a single dataset file without printing."""
+    cycles = _iter_cycles(dataset_path)
+    parts = []
+    # Filter in fixed-size chunks so streamed input is never fully materialized
+    while True:
+        chunk = list(islice(cycles, FILTER_CHUNK_SIZE))
+        if not chunk:
+            break
+        parts.append(_filter_cycles(chunk))
+    return _concat_datasets(parts)
+
+
+def _log_load_summary(dataset_path, dataset):
+    """Log the cycle, ground truth and doubles counts of a loaded dataset."""
+    n = len(dataset['v'])
+    logger.info("  Loaded %d cycles from %s", n, dataset_path)
+    logger.info("  Non-zero ground truth count: %d", n)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("  Doubles count: %d", np.count_nonzero(dataset['gt_len'] > 1))
+
+
+def get_dataset(dataset_path):
+    """
+    Load a single dataset from a JSON file.
     
-    print(f"  Loaded {len(dataset)} cycles from {dataset_path}")
-    print(f"  Non-zero ground truth count: {non_zero_gt_count}")
-    print(f"  Doubles count: {doubles_count}")
+    Returns:
+        Columnar dataset of the cycles that pass the filter:
+        'v', 't', 'gt_last' (last gt spike time) and 'gt_len' (spike count)
+        as NumPy arrays, plus the raw 'gt_lists'
+    """
+    dataset = _load_dataset(dataset_path)
+    _log_load_summary(dataset_path, dataset)
     return dataset
 
 
@@ -63,32 +259,111 @@ def get_combined_dataset(dataset_paths):
         dataset_paths: List of paths to JSON dataset files
         
     Returns:
-        Combined dataset list
+        Combined columnar dataset (see get_dataset)
     """
     if isinstance(dataset_paths, str):
         dataset_paths = [dataset_paths]
     
-    print(f"\nLoading {len(dataset_paths)} dataset file(s)...")
-    combined_dataset = []
+    logger.info("\nLoading %d dataset file(s)...", len(dataset_paths))
+    if len(dataset_paths) > 1:
+        # Files are independent, so parse them in parallel and report in order
+        workers = min(len(dataset_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_load_dataset, dataset_paths))
+    else:
+        results = [_load_dataset(path) for path in dataset_paths]
     
-    for path in dataset_paths:
-        print(f"\nProcessing: {path}")
-        dataset = get_dataset(path)
-        combined_dataset.extend(dataset)
+    for path, dataset in zip(dataset_paths, results):
+        logger.info("\nProcessing: %s", path)
+        _log_load_summary(path, dataset)
+    combined_dataset = _concat_datasets(results)
     
-    print(f"\n{'='*60}")
-    print(f"Combined dataset size: {len(combined_dataset)} cycles")
-    print(f"{'='*60}\n")
+    logger.info("\n%s", '=' * 60)
+    logger.info("Combined dataset size: %d cycles", len(combined_dataset['v']))
+    logger.info("%s\n", '=' * 60)
     
     return combined_dataset
 
 
+def _summarize(arr) -> Dict:
+    """Order statistics from a single percentile call plus mean and std."""
+    q0, q25, median, q75, q100 = np.percentile(arr, [0, 25, 50, 75, 100])
+    return {
+        'min': q0,
+        'q25': q25,
+        'median': median,
+        'q75': q75,
+        'max': q100,
+        # Accumulate in float64 so float32 inputs do not lose precision
+        'mean': arr.mean(dtype=np.float64),
+        'std': arr.std(dtype=np.float64),
+    }
+
+
+def _save_figure(fig, save_path):
+    """Save a plot figure with the report's shared output settings."""
+    # Lay out once at draw time instead of paying bbox_inches='tight''s extra
+    # render pass to measure the bounds
+    if fig.get_layout_engine() is None:
+        fig.set_layout_engine('tight')
+    fig.savefig(save_path, dpi=SAVE_DPI)
+
+
+def _scatter_indices(n, labels=None, cap=SCATTER_MAX_POINTS):
+    """
+    Pick at most cap of n points to draw in a scatter plot.
+    
+    Past a few tens of thousands of points extra markers only overplot, so
+    larger inputs are subsampled (with a fixed seed, so reports are
+    reproducible). If labels is given, each label group keeps its share of
+    the points. Histograms and statistics should keep using the full arrays.
+    
+    Returns:
+        slice(None) when nothing is dropped, otherwise sorted indices
+    """
+    if n <= cap:
+        return slice(None)
+    rng = np.random.default_rng(0)
+    if labels is None:
+        return np.sort(rng.choice(n, size=cap, replace=False))
+    picked = []
+    for label in np.unique(labels):
+        group = np.flatnonzero(labels == label)
+        size = min(len(group), max(1, round(cap * len(group) / n)))
+        picked.append(rng.choice(group, size=size, replace=False))
+    return np.sort(np.concatenate(picked))
+
+
+def _overlay_histograms(ax, data, groups, bins, **bar_kwargs):
+    """
+    Draw overlaid histograms of subsets of data on shared bin edges.
+    
+    Args:
+        ax: Axes to draw on
+        data: Full array the bin edges are computed from
+        groups: (subset, color, label) triples; empty subsets are skipped
+        bins: Number of bins
+    """
+    edges = np.histogram_bin_edges(data, bins=bins)
+    widths = np.diff(edges)
+    for subset, color, label in groups:
+        if len(subset) == 0:
+            continue
+        counts, _ = np.histogram(subset, bins=edges)
+        ax.bar(edges[:-1], counts, width=widths, align='edge', color=color,
+               label=label, **bar_kwargs)
+
+
 class DatasetExplorer:
     """
     Exploratory Data Analysis for capacitor discharge dataset.
     Now includes visualization for multi-spike cycles.
     """
     
+    # Parsed data keyed on (paths, file mtimes, v_initial_guess), shared by all
+    # explorers so repeated reports on unchanged inputs skip parsing
+    _CACHE: Dict = {}
+    
     def __init__(self, v_initial_guess: float = 2.5):
         """
         Args:
@@ -107,65 +382,65 @@ class DatasetExplorer:
         Returns:
             Dictionary with parsed data
         """
+        paths = (dataset_path,) if isinstance(dataset_path, str) else tuple(dataset_path)
+        key = (paths, tuple(os.path.getmtime(p) for p in paths), self.v_initial_guess)
+        cached = self._CACHE.get(key)
+        if cached is not None:
+            self.data = dict(cached)
+            return self.data
+        
         # Support both single path and list of paths
         if isinstance(dataset_path, str):
             dataset = get_dataset(dataset_path)
         else:
             dataset = get_combined_dataset(dataset_path)
         
-        v_currents = []
-        gt_times = []
-        cycle_lengths = []
-        num_spikes = []
-        valid_indices = []
-        invalid_reasons = []
-        has_multiple_spikes = []  # NEW: Track if cycle had multiple spikes
-        
-        for idx, exp_data in enumerate(dataset):
-            v_current = float(exp_data["v"])
-            t_cycle = exp_data["t"]
-            cycle_lengths.append(t_cycle)
-            spike_count = len(exp_data["gt"])
-            num_spikes.append(spike_count)
-            
-            # Check if valid data point
-            if not exp_data["gt"]:
-                invalid_reasons.append((idx, "no_spikes", v_current, None))
-                continue
-            
-            gt_time_us = t_cycle - exp_data["gt"][-1]
-            
-            # Track invalid data
-            if gt_time_us <= 0:
-                invalid_reasons.append((idx, "negative_time", v_current, gt_time_us))
-                continue
-            if v_current >= self.v_initial_guess:
-                invalid_reasons.append((idx, "v_too_high", v_current, gt_time_us))
-                continue
-            if v_current <= 0:
-                invalid_reasons.append((idx, "v_negative", v_current, gt_time_us))
-                continue
-            
-            # Valid data
-            v_currents.append(v_current)
-            gt_times.append(gt_time_us)
-            valid_indices.append(idx)
-            has_multiple_spikes.append(spike_count > 1)  # NEW: Track if multiple spikes
+        v = dataset['v']
+        cycle_lengths = dataset['t']
+        num_spikes = dataset['gt_len']
+        gt_time = cycle_lengths - dataset['gt_last']
+        
+        codes = classify_cycles(v, gt_time, num_spikes, self.v_initial_guess)
+        valid = codes == REASON_VALID
+        
+        invalid_reasons = [
+            (idx, REASON_NAMES[codes[idx]], v[idx],
+             None if codes[idx] == REASON_NO_SPIKES else gt_time[idx])
+            for idx in np.flatnonzero(~valid).tolist()
+        ]
+        # Classify in float64, then store float32: half the bandwidth for every
+        # stats/plot pass, and ample precision at microsecond resolution
+        v_currents = v[valid].astype(np.float32)
+        gt_times = gt_time[valid].astype(np.float32)
+        valid_indices = np.flatnonzero(valid).tolist()
+        spike_counts_valid = num_spikes[valid]
+        has_multiple_spikes = spike_counts_valid > 1
         
         self.data = {
-            'v_currents': np.array(v_currents),
-            'gt_times': np.array(gt_times),
-            'cycle_lengths': np.array(cycle_lengths),
-            'num_spikes': np.array(num_spikes),
+            'v_currents': v_currents,
+            'gt_times': gt_times,
+            'cycle_lengths': cycle_lengths.astype(np.float32),
+            'num_spikes': num_spikes,
             'valid_indices': valid_indices,
             'invalid_reasons': invalid_reasons,
-            'has_multiple_spikes': np.array(has_multiple_spikes),  # NEW
-            'total_samples': len(dataset),
+            'has_multiple_spikes': has_multiple_spikes,  # NEW
+            'spike_counts_valid': spike_counts_valid,
+            'total_samples': len(v),
             'valid_samples': len(v_currents)
         }
+        self._CACHE[key] = dict(self.data)
         
         return self.data
     
+    def _stats(self) -> Dict:
+        """Summary statistics per data array, computed once and cached in self.data."""
+        stats = self.data.get('stats')
+        if stats is None:
+            stats = {key: _summarize(self.data[key])
+                     for key in ('v_currents', 'gt_times', 'cycle_lengths')}
+            self.data['stats'] = stats
+        return stats
+    
     def print_summary_statistics(self):
         """Print comprehensive dataset statistics."""
         if self.data is None:
@@ -182,17 +457,16 @@ class DatasetExplorer:
         print(f"{'Valid Ratio:':<30} {self.data['valid_samples']/self.data['total_samples']*100:.2f}%")
         
         # NEW: Multi-spike statistics
-        multi_spike_count = self.data['has_multiple_spikes'].sum()
-        single_spike_count = (~self.data['has_multiple_spikes']).sum()
+        multi_mask = self.data['has_multiple_spikes']
+        multi_spike_count = np.count_nonzero(multi_mask)
+        single_spike_count = len(multi_mask) - multi_spike_count
         print(f"\n{'Single Spike Cycles:':<30} {single_spike_count} ({single_spike_count/self.data['valid_samples']*100:.1f}%)")
         print(f"{'Multi-Spike Cycles:':<30} {multi_spike_count} ({multi_spike_count/self.data['valid_samples']*100:.1f}%)")
         
         # Invalid data breakdown
         if self.data['invalid_reasons']:
             print(f"\n{'Invalid Data Breakdown:':}")
-            reasons_count = {}
-            for _, reason, _, _ in self.data['invalid_reasons']:
-                reasons_count[reason] = reasons_count.get(reason, 0) + 1
+            reasons_count = Counter(reason for _, reason, _, _ in self.data['invalid_reasons'])
             for reason, count in reasons_count.items():
                 print(f"  - {reason:<20} {count:>5} samples")
         
@@ -200,16 +474,18 @@ class DatasetExplorer:
         print(" "*25 + "VOLTAGE STATISTICS")
         print("-"*70)
         v = self.data['v_currents']
-        print(f"{'Min Voltage:':<30} {v.min():.6f} V")
-        print(f"{'Max Voltage:':<30} {v.max():.6f} V")
-        print(f"{'Mean Voltage:':<30} {v.mean():.6f} V")
-        print(f"{'Median Voltage:':<30} {np.median(v):.6f} V")
-        print(f"{'Std Voltage:':<30} {v.std():.6f} V")
-        print(f"{'Voltage Range:':<30} {v.max() - v.min():.6f} V")
+        stats = self._stats()
+        vs = stats['v_currents']
+        print(f"{'Min Voltage:':<30} {vs['min']:.6f} V")
+        print(f"{'Max Voltage:':<30} {vs['max']:.6f} V")
+        print(f"{'Mean Voltage:':<30} {vs['mean']:.6f} V")
+        print(f"{'Median Voltage:':<30} {vs['median']:.6f} V")
+        print(f"{'Std Voltage:':<30} {vs['std']:.6f} V")
+        print(f"{'Voltage Range:':<30} {vs['max'] - vs['min']:.6f} V")
         
         # NEW: Compare voltage between single and multi-spike cycles
-        single_spike_v = v[~self.data['has_multiple_spikes']]
-        multi_spike_v = v[self.data['has_multiple_spikes']]
+        single_spike_v = v[~multi_mask]
+        multi_spike_v = v[multi_mask]
         if len(multi_spike_v) > 0:
             print(f"\n{'Single-Spike Mean V:':<30} {single_spike_v.mean():.6f} V")
             print(f"{'Multi-Spike Mean V:':<30} {multi_spike_v.mean():.6f} V")
@@ -218,22 +494,22 @@ class DatasetExplorer:
         print("\n" + "-"*70)
         print(" "*25 + "SPIKE TIME STATISTICS")
         print("-"*70)
-        t = self.data['gt_times']
-        print(f"{'Min Time:':<30} {t.min():.2f} μs")
-        print(f"{'Max Time:':<30} {t.max():.2f} μs")
-        print(f"{'Mean Time:':<30} {t.mean():.2f} μs")
-        print(f"{'Median Time:':<30} {np.median(t):.2f} μs")
-        print(f"{'Std Time:':<30} {t.std():.2f} μs")
-        print(f"{'Time Range:':<30} {t.max() - t.min():.2f} μs")
+        ts = stats['gt_times']
+        print(f"{'Min Time:':<30} {ts['min']:.2f} μs")
+        print(f"{'Max Time:':<30} {ts['max']:.2f} μs")
+        print(f"{'Mean Time:':<30} {ts['mean']:.2f} μs")
+        print(f"{'Median Time:':<30} {ts['median']:.2f} μs")
+        print(f"{'Std Time:':<30} {ts['std']:.2f} μs")
+        print(f"{'Time Range:':<30} {ts['max'] - ts['min']:.2f} μs")
         
         print("\n" + "-"*70)
         print(" "*25 + "CYCLE STATISTICS")
         print("-"*70)
-        c = self.data['cycle_lengths']
-        print(f"{'Mean Cycle Length:':<30} {c.mean():.2f} μs")
-        print(f"{'Median Cycle Length:':<30} {np.median(c):.2f} μs")
-        print(f"{'Max Cycle Length:':<30} {c.max():.2f} μs")
-        print(f"{'Min Cycle Length:':<30} {c.min():.2f} μs")
+        cs = stats['cycle_lengths']
+        print(f"{'Mean Cycle Length:':<30} {cs['mean']:.2f} μs")
+        print(f"{'Median Cycle Length:':<30} {cs['median']:.2f} μs")
+        print(f"{'Max Cycle Length:':<30} {cs['max']:.2f} μs")
+        print(f"{'Min Cycle Length:':<30} {cs['min']:.2f} μs")
         
         print("\n" + "-"*70)
         print(" "*25 + "SPIKE STATISTICS")
@@ -245,6 +521,23 @@ class DatasetExplorer:
         
         print("\n" + "="*70 + "\n")
     
+    def _plot_spike_density(self, ax, v, t, colors, s, linewidths, log_y=False):
+        """
+        Voltage vs time colored by spike count.
+        
+        Small datasets get a per-point scatter. Large ones are binned with
+        hexbin, colored by the fraction of multi-spike cycles per bin, so the
+        drawing cost stays fixed no matter how many cycles there are.
+        """
+        if len(v) <= HEXBIN_MIN_POINTS:
+            idx = _scatter_indices(len(v), self.data['has_multiple_spikes'])
+            ax.scatter(v[idx], t[idx], alpha=0.6, s=s, c=colors[idx], edgecolors='black',
+                       linewidths=linewidths, rasterized=True)
+            return None
+        return ax.hexbin(v, t, C=self.data['has_multiple_spikes'], reduce_C_function=np.mean,
+                         gridsize=80, cmap='coolwarm', vmin=0, vmax=1, mincnt=1,
+                         yscale='log' if log_y else 'linear')
+    
     def plot_comprehensive_eda(self, save_path: str = None, dataset_path: str = ""):
         """
         Create comprehensive EDA visualizations.
@@ -254,18 +547,29 @@ class DatasetExplorer:
             print("No data loaded. Call load_and_parse_data() first.")
             return
         
-        fig = plt.figure(figsize=(18, 12))
-        gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
+        # Spanning gridspec axes need constrained layout (tight_layout cannot
+        # handle them); it also places the suptitle and sets the spacing
+        fig = plt.figure(figsize=(18, 12), layout='constrained')
+        gs = fig.add_gridspec(3, 3)
         
         v = self.data['v_currents']
         t = self.data['gt_times']
+        multi_mask = self.data['has_multiple_spikes']
+        single_mask = ~multi_mask
+        v_single = v[single_mask]
+        v_multi = v[multi_mask]
+        stats = self._stats()
+        vs = stats['v_currents']
+        ts = stats['gt_times']
         
         # 1. Voltage vs Time Scatter (Main plot) - NEW: Color-coded by spike count
         ax1 = fig.add_subplot(gs[0:2, 0:2])
         
         # Color based on multiple spikes: RED for multi-spike, BLUE for single-spike
-        colors = np.where(self.data['has_multiple_spikes'], '#e74c3c', '#3498db')
-        scatter = ax1.scatter(v, t, alpha=0.6, s=35, c=colors, edgecolors='black', linewidths=0.3)
+        colors = np.where(multi_mask, '#e74c3c', '#3498db')
+        density = self._plot_spike_density(ax1, v, t, colors, s=35, linewidths=0.3)
+        if density is not None:
+            fig.colorbar(density, ax=ax1, label='Multi-Spike Fraction')
         
         ax1.set_xlabel('Voltage (V)', fontsize=12)
         ax1.set_ylabel('Time Since Last Spike (μs)', fontsize=12)
@@ -275,8 +579,8 @@ class DatasetExplorer:
         # Add v_initial reference line and create comprehensive legend
         ax1.axvline(self.v_initial_guess, color='green', linestyle='--', linewidth=2)
         
-        multi_count = self.data['has_multiple_spikes'].sum()
-        single_count = (~self.data['has_multiple_spikes']).sum()
+        multi_count = len(v_multi)
+        single_count = len(v_single)
         
         legend_elements = [
             Patch(facecolor='#3498db', edgecolor='black', alpha=0.6, 
@@ -290,14 +594,11 @@ class DatasetExplorer:
         
         # 2. Voltage Distribution - NEW: Split by spike count
         ax2 = fig.add_subplot(gs[0, 2])
-        v_single = v[~self.data['has_multiple_spikes']]
-        v_multi = v[self.data['has_multiple_spikes']]
         
-        ax2.hist(v_single, bins=40, alpha=0.6, color='#3498db', edgecolor='black', label='Single')
-        if len(v_multi) > 0:
-            ax2.hist(v_multi, bins=40, alpha=0.6, color='#e74c3c', edgecolor='black', label='Multi')
+        _overlay_histograms(ax2, v, [(v_single, '#3498db', 'Single'), (v_multi, '#e74c3c', 'Multi')],
+                            bins=40, alpha=0.6, edgecolor='black')
         
-        ax2.axvline(v.mean(), color='black', linestyle='--', linewidth=2, label='Overall Mean')
+        ax2.axvline(vs['mean'], color='black', linestyle='--', linewidth=2, label='Overall Mean')
         ax2.set_xlabel('Voltage (V)', fontsize=10)
         ax2.set_ylabel('Frequency', fontsize=10)
         ax2.set_title('Voltage Distribution by Spike Count', fontsize=12, fontweight='bold')
@@ -307,8 +608,8 @@ class DatasetExplorer:
         # 3. Time Distribution
         ax3 = fig.add_subplot(gs[1, 2])
         ax3.hist(t, bins=50, alpha=0.7, color='coral', edgecolor='black')
-        ax3.axvline(t.mean(), color='red', linestyle='--', linewidth=2, label='Mean')
-        ax3.axvline(np.median(t), color='orange', linestyle='--', linewidth=2, label='Median')
+        ax3.axvline(ts['mean'], color='red', linestyle='--', linewidth=2, label='Mean')
+        ax3.axvline(ts['median'], color='orange', linestyle='--', linewidth=2, label='Median')
         ax3.set_xlabel('Time (μs)', fontsize=10)
         ax3.set_ylabel('Frequency', fontsize=10)
         ax3.set_title('Time Distribution', fontsize=12, fontweight='bold')
@@ -317,7 +618,7 @@ class DatasetExplorer:
         
         # 4. Voltage vs Time (Log scale) - NEW: Color-coded
         ax4 = fig.add_subplot(gs[2, 0])
-        ax4.scatter(v, t, alpha=0.6, s=20, c=colors, edgecolors='black', linewidths=0.2)
+        self._plot_spike_density(ax4, v, t, colors, s=20, linewidths=0.2, log_y=True)
         ax4.set_xlabel('Voltage (V)', fontsize=10)
         ax4.set_ylabel('Time (μs) - Log Scale', fontsize=10)
         ax4.set_yscale('log')
@@ -327,17 +628,18 @@ class DatasetExplorer:
         # 5. Voltage Ratio Distribution - NEW: Split by spike count
         ax5 = fig.add_subplot(gs[2, 1])
         voltage_ratio = v / self.v_initial_guess
-        voltage_ratio_single = voltage_ratio[~self.data['has_multiple_spikes']]
-        voltage_ratio_multi = voltage_ratio[self.data['has_multiple_spikes']]
+        voltage_ratio_single = v_single / self.v_initial_guess
+        voltage_ratio_multi = v_multi / self.v_initial_guess
         
-        ax5.hist(voltage_ratio_single, bins=40, alpha=0.6, color='#3498db', edgecolor='black', label='Single')
-        if len(voltage_ratio_multi) > 0:
-            ax5.hist(voltage_ratio_multi, bins=40, alpha=0.6, color='#e74c3c', edgecolor='black', label='Multi')
+        _overlay_histograms(ax5, voltage_ratio,
+                            [(voltage_ratio_single, '#3498db', 'Single'),
+                             (voltage_ratio_multi, '#e74c3c', 'Multi')],
+                            bins=40, alpha=0.6, edgecolor='black')
         
         ax5.set_xlabel('Voltage Ratio (V/V_initial)', fontsize=10)
         ax5.set_ylabel('Frequency', fontsize=10)
         ax5.set_title('Voltage Ratio by Spike Count', fontsize=12, fontweight='bold')
-        ax5.axvline(voltage_ratio.mean(), color='black', linestyle='--', linewidth=2, label='Mean')
+        ax5.axvline(vs['mean'] / self.v_initial_guess, color='black', linestyle='--', linewidth=2, label='Mean')
         ax5.legend()
         ax5.grid(True, alpha=0.3, axis='y')
         
@@ -361,42 +663,28 @@ class DatasetExplorer:
         title = 'Comprehensive Dataset Exploration - Multi-Spike Analysis'
         if dataset_path:
             title += f'\nPath: {dataset_path}'
-        plt.suptitle(title, fontsize=16, fontweight='bold', y=0.995)
+        plt.suptitle(title, fontsize=16, fontweight='bold')
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            _save_figure(fig, save_path)
         
         # # plt.show()
+        plt.close(fig)
     
-    def plot_multispike_comparison(self, save_path: str = None, dataset_path=None):
+    def plot_multispike_comparison(self, save_path: str = None):
         """
         NEW: Dedicated plot to compare cycles with different numbers of spikes (1, 2, 3+).
         
         Args:
-            save_path: Path to save the plot
-            dataset_path: Path(s) to the dataset file (needed to re-load spike counts)
+            save_path: Path or binary file-like object to save the plot to
         """
         if self.data is None:
             print("No data loaded. Call load_and_parse_data() first.")
             return
         
-        if dataset_path is None:
-            print("Error: dataset_path is required for multispike comparison.")
-            return
-        
         v = self.data['v_currents']
         t = self.data['gt_times']
-        
-        # Get indices for each spike count - handle both single and multiple files
-        if isinstance(dataset_path, str):
-            dataset = get_dataset(dataset_path)
-        else:
-            dataset = get_combined_dataset(dataset_path)
-        
-        spike_counts = []
-        for idx in self.data['valid_indices']:
-            spike_counts.append(len(dataset[idx]['gt']))
-        spike_counts = np.array(spike_counts)
+        spike_counts = self.data['spike_counts_valid']
         
         # Separate data by spike count
         single_spike_mask = spike_counts == 1
@@ -415,6 +703,12 @@ class DatasetExplorer:
         print(f"  Double spike: {len(v_double)} ({len(v_double)/len(v)*100:.1f}%)")
         print(f"  Triple+ spike: {len(v_triple)} ({len(v_triple)/len(v)*100:.1f}%)")
         
+        # Per-group (v mean, v std, t mean, t std), shared by the mean markers,
+        # the summary table and the printout; None for an empty group
+        moments = [(gv.mean(), gv.std(), gt.mean(), gt.std()) if len(gv) > 0 else None
+                   for gv, gt in ((v_single, t_single), (v_double, t_double), (v_triple, t_triple))]
+        present_moments = [m for m in moments if m is not None]
+        
         fig, axes = plt.subplots(2, 3, figsize=(18, 10))
         
         # Colors for different spike counts
@@ -423,15 +717,23 @@ class DatasetExplorer:
         
         # 1. Overlaid scatter plot
         ax1 = axes[0, 0]
+        # Stratified subsample: each group keeps its share of the scatter budget
+        # (at least one point), while the labels show the full counts
+        group_labels = np.minimum(spike_counts, 3)
+        idx = _scatter_indices(len(v), group_labels)
+        v_shown, t_shown, labels_shown = v[idx], t[idx], group_labels[idx]
+        shown_single = labels_shown == 1
+        shown_double = labels_shown == 2
+        shown_triple = labels_shown == 3
         if len(v_single) > 0:
-            ax1.scatter(v_single, t_single, alpha=0.5, s=20, c=colors[0], 
-                       label=f'Single ({len(v_single)})', edgecolors='black', linewidths=0.2)
+            ax1.scatter(v_shown[shown_single], t_shown[shown_single], alpha=0.5, s=20, c=colors[0], 
+                       label=f'Single ({len(v_single)})', edgecolors='black', linewidths=0.2, rasterized=True)
         if len(v_double) > 0:
-            ax1.scatter(v_double, t_double, alpha=0.7, s=30, c=colors[1], 
-                       label=f'Double ({len(v_double)})', edgecolors='black', linewidths=0.3)
+            ax1.scatter(v_shown[shown_double], t_shown[shown_double], alpha=0.7, s=30, c=colors[1], 
+                       label=f'Double ({len(v_double)})', edgecolors='black', linewidths=0.3, rasterized=True)
         if len(v_triple) > 0:
-            ax1.scatter(v_triple, t_triple, alpha=0.8, s=40, c=colors[2], 
-                       label=f'Triple+ ({len(v_triple)})', edgecolors='black', linewidths=0.3)
+            ax1.scatter(v_shown[shown_triple], t_shown[shown_triple], alpha=0.8, s=40, c=colors[2], 
+                       label=f'Triple+ ({len(v_triple)})', edgecolors='black', linewidths=0.3, rasterized=True)
         
         ax1.set_xlabel('Voltage (V)', fontsize=11)
         ax1.set_ylabel('Time Since Last Spike (μs)', fontsize=11)
@@ -468,8 +770,8 @@ class DatasetExplorer:
         ax2.grid(True, alpha=0.3, axis='y')
         
         # Add mean markers
-        for i, (data, color) in enumerate(zip(box_data, box_colors)):
-            ax2.plot([i+1], [data.mean()], marker='D', color=color, 
+        for i, (m, color) in enumerate(zip(present_moments, box_colors)):
+            ax2.plot([i+1], [m[0]], marker='D', color=color, 
                     markersize=8, markeredgecolor='black')
         
         # 3. Time comparison boxplot
@@ -492,21 +794,17 @@ class DatasetExplorer:
         ax3.grid(True, alpha=0.3, axis='y')
         
         # Add mean markers
-        for i, (data, color) in enumerate(zip(time_data, box_colors)):
-            ax3.plot([i+1], [data.mean()], marker='D', color=color, 
+        for i, (m, color) in enumerate(zip(present_moments, box_colors)):
+            ax3.plot([i+1], [m[2]], marker='D', color=color, 
                     markersize=8, markeredgecolor='black')
         
         # 4. Voltage histograms
         ax4 = axes[1, 0]
-        if len(v_single) > 0:
-            ax4.hist(v_single, bins=30, alpha=0.6, color=colors[0], 
-                    label='Single', edgecolor='black', linewidth=0.5)
-        if len(v_double) > 0:
-            ax4.hist(v_double, bins=30, alpha=0.6, color=colors[1], 
-                    label='Double', edgecolor='black', linewidth=0.5)
-        if len(v_triple) > 0:
-            ax4.hist(v_triple, bins=30, alpha=0.6, color=colors[2], 
-                    label='Triple+', edgecolor='black', linewidth=0.5)
+        _overlay_histograms(ax4, v,
+                            [(v_single, colors[0], 'Single'),
+                             (v_double, colors[1], 'Double'),
+                             (v_triple, colors[2], 'Triple+')],
+                            bins=30, alpha=0.6, edgecolor='black', linewidth=0.5)
         
         ax4.set_xlabel('Voltage (V)', fontsize=11)
         ax4.set_ylabel('Frequency', fontsize=11)
@@ -516,15 +814,11 @@ class DatasetExplorer:
         
         # 5. Time histograms
         ax5 = axes[1, 1]
-        if len(t_single) > 0:
-            ax5.hist(t_single, bins=30, alpha=0.6, color=colors[0], 
-                    label='Single', edgecolor='black', linewidth=0.5)
-        if len(t_double) > 0:
-            ax5.hist(t_double, bins=30, alpha=0.6, color=colors[1], 
-                    label='Double', edgecolor='black', linewidth=0.5)
-        if len(t_triple) > 0:
-            ax5.hist(t_triple, bins=30, alpha=0.6, color=colors[2], 
-                    label='Triple+', edgecolor='black', linewidth=0.5)
+        _overlay_histograms(ax5, t,
+                            [(t_single, colors[0], 'Single'),
+                             (t_double, colors[1], 'Double'),
+                             (t_triple, colors[2], 'Triple+')],
+                            bins=30, alpha=0.6, edgecolor='black', linewidth=0.5)
         
         ax5.set_xlabel('Time Since Last Spike (μs)', fontsize=11)
         ax5.set_ylabel('Frequency', fontsize=11)
@@ -544,27 +838,11 @@ class DatasetExplorer:
                           f'{len(v_double)}' if len(v_double) > 0 else '0',
                           f'{len(v_triple)}' if len(v_triple) > 0 else '0'])
         
-        # Voltage stats
-        stats_data.append(['V Mean (V)', 
-                          f'{v_single.mean():.4f}' if len(v_single) > 0 else 'N/A',
-                          f'{v_double.mean():.4f}' if len(v_double) > 0 else 'N/A',
-                          f'{v_triple.mean():.4f}' if len(v_triple) > 0 else 'N/A'])
-        
-        stats_data.append(['V Std (V)', 
-                          f'{v_single.std():.4f}' if len(v_single) > 0 else 'N/A',
-                          f'{v_double.std():.4f}' if len(v_double) > 0 else 'N/A',
-                          f'{v_triple.std():.4f}' if len(v_triple) > 0 else 'N/A'])
-        
-        # Time stats
-        stats_data.append(['T Mean (μs)', 
-                          f'{t_single.mean():.2f}' if len(t_single) > 0 else 'N/A',
-                          f'{t_double.mean():.2f}' if len(t_double) > 0 else 'N/A',
-                          f'{t_triple.mean():.2f}' if len(t_triple) > 0 else 'N/A'])
-        
-        stats_data.append(['T Std (μs)', 
-                          f'{t_single.std():.2f}' if len(t_single) > 0 else 'N/A',
-                          f'{t_double.std():.2f}' if len(t_double) > 0 else 'N/A',
-                          f'{t_triple.std():.2f}' if len(t_triple) > 0 else 'N/A'])
+        # Voltage and time stats
+        for row, k, fmt in (('V Mean (V)', 0, '.4f'), ('V Std (V)', 1, '.4f'),
+                            ('T Mean (μs)', 2, '.2f'), ('T Std (μs)', 3, '.2f')):
+            stats_data.append([row] + [format(m[k], fmt) if m is not None else 'N/A'
+                                       for m in moments])
         
         table = ax6.table(cellText=stats_data, cellLoc='center', loc='center',
                          colWidths=[0.25, 0.25, 0.25, 0.25])
@@ -587,31 +865,23 @@ class DatasetExplorer:
         ax6.set_title('Statistical Summary', fontsize=13, fontweight='bold', pad=20)
         
         plt.suptitle('Multi-Spike Analysis by Spike Count (1, 2, 3+)', fontsize=16, fontweight='bold')
-        plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            _save_figure(fig, save_path)
         
         # # plt.show()
+        plt.close(fig)
         
         # Print detailed statistics
         print("\nDetailed Statistics:")
         print("-" * 60)
         
-        if len(v_single) > 0:
-            print(f"Single Spike Cycles ({len(v_single)} samples):")
-            print(f"  Voltage: {v_single.mean():.4f} ± {v_single.std():.4f} V")
-            print(f"  Time: {t_single.mean():.2f} ± {t_single.std():.2f} μs")
-        
-        if len(v_double) > 0:
-            print(f"Double Spike Cycles ({len(v_double)} samples):")
-            print(f"  Voltage: {v_double.mean():.4f} ± {v_double.std():.4f} V")
-            print(f"  Time: {t_double.mean():.2f} ± {t_double.std():.2f} μs")
-        
-        if len(v_triple) > 0:
-            print(f"Triple+ Spike Cycles ({len(v_triple)} samples):")
-            print(f"  Voltage: {v_triple.mean():.4f} ± {v_triple.std():.4f} V")
-            print(f"  Time: {t_triple.mean():.2f} ± {t_triple.std():.2f} μs")
+        for name, gv, m in (('Single', v_single, moments[0]), ('Double', v_double, moments[1]),
+                            ('Triple+', v_triple, moments[2])):
+            if m is not None:
+                print(f"{name} Spike Cycles ({len(gv)} samples):")
+                print(f"  Voltage: {m[0]:.4f} ± {m[1]:.4f} V")
+                print(f"  Time: {m[2]:.2f} ± {m[3]:.2f} μs")
     
     def plot_theoretical_curves(self, R_guesses: List[float] = None, save_path: str = None):
         """
@@ -619,6 +889,7 @@ class DatasetExplorer:
         
         Args:
             R_guesses: List of resistance values to plot (in Ohms)
+            save_path: Path or binary file-like object to save the plot to
         """
         if self.data is None:
             print("No data loaded. Call load_and_parse_data() first.")
@@ -633,55 +904,57 @@ class DatasetExplorer:
         v = self.data['v_currents']
         t = self.data['gt_times']
         
+        idx = _scatter_indices(len(v))
+        v_shown, t_shown = v[idx], t[idx]
+        
         # Plot 1: Linear scale
         ax1 = axes[0]
-        ax1.scatter(v, t, alpha=0.3, s=20, color='gray', label='Actual Data', zorder=1)
+        ax1.scatter(v_shown, t_shown, alpha=0.3, s=20, color='gray', label='Actual Data', zorder=1, rasterized=True)
         
         # Generate theoretical curves
         v_range = np.linspace(v.min(), min(v.max(), self.v_initial_guess * 0.99), 200)
         
         colors = plt.cm.rainbow(np.linspace(0, 1, len(R_guesses)))
         
-        for R, color in zip(R_guesses, colors):
-            # t = -RC * ln(V/V0)
-            C = 30e-12  # 30 pF from paper
-            tau = R * C
-            t_theoretical = -tau * np.log(v_range / self.v_initial_guess) * 1e6  # Convert to μs
-            
-            ax1.plot(v_range, t_theoretical, color=color, linewidth=2, 
-                    label=f'R = {R:.1e} Ω', zorder=2)
+        # t = -RC * ln(V/V0), one row per R; the log term is shared by every curve
+        C = 30e-12  # 30 pF from paper
+        log_term = np.log(v_range / self.v_initial_guess)
+        t_theoretical_curves = -C * 1e6 * np.asarray(R_guesses)[:, None] * log_term[None, :]  # μs
+        
+        # All curves go into one LineCollection per axis; the legend uses proxy handles
+        segments = np.stack([np.broadcast_to(v_range, t_theoretical_curves.shape),
+                             t_theoretical_curves], axis=-1)
+        curve_handles = [Line2D([0], [0], color=color, linewidth=2, label=f'R = {R:.1e} Ω')
+                         for R, color in zip(R_guesses, colors)]
+        
+        ax1.add_collection(LineCollection(segments, colors=colors, linewidths=2, zorder=2))
+        ax1.autoscale_view()
         
         ax1.set_xlabel('Voltage (V)', fontsize=12)
         ax1.set_ylabel('Time (μs)', fontsize=12)
         ax1.set_title('Theoretical Discharge Curves vs Actual Data', fontsize=14, fontweight='bold')
-        ax1.legend(loc='best', fontsize=10)
+        ax1.legend(handles=ax1.get_legend_handles_labels()[0] + curve_handles, loc='best', fontsize=10)
         ax1.grid(True, alpha=0.3)
         
         # Plot 2: Log scale
         ax2 = axes[1]
-        ax2.scatter(v, t, alpha=0.3, s=20, color='gray', label='Actual Data', zorder=1)
+        ax2.scatter(v_shown, t_shown, alpha=0.3, s=20, color='gray', label='Actual Data', zorder=1, rasterized=True)
         
-        for R, color in zip(R_guesses, colors):
-            C = 30e-12
-            tau = R * C
-            t_theoretical = -tau * np.log(v_range / self.v_initial_guess) * 1e6
-            
-            ax2.plot(v_range, t_theoretical, color=color, linewidth=2, 
-                    label=f'R = {R:.1e} Ω', zorder=2)
+        ax2.add_collection(LineCollection(segments, colors=colors, linewidths=2, zorder=2))
+        ax2.autoscale_view()
         
         ax2.set_xlabel('Voltage (V)', fontsize=12)
         ax2.set_ylabel('Time (μs) - Log Scale', fontsize=12)
         ax2.set_yscale('log')
         ax2.set_title('Theoretical Curves (Log Scale)', fontsize=14, fontweight='bold')
-        ax2.legend(loc='best', fontsize=10)
+        ax2.legend(handles=ax2.get_legend_handles_labels()[0] + curve_handles, loc='best', fontsize=10)
         ax2.grid(True, alpha=0.3, which='both')
         
-        plt.tight_layout()
-        
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            _save_figure(fig, save_path)
         
         # plt.show()
+        plt.close(fig)
     
     def plot_outlier_analysis(self, save_path: str = None):
         """
@@ -693,6 +966,9 @@ class DatasetExplorer:
         
         v = self.data['v_currents']
         t = self.data['gt_times']
+        stats = self._stats()
+        vs = stats['v_currents']
+        ts = stats['gt_times']
         
         fig, axes = plt.subplots(2, 2, figsize=(14, 10))
         
@@ -705,11 +981,11 @@ class DatasetExplorer:
         ax1.grid(True, alpha=0.3, axis='y')
         
         # Calculate and display outliers
-        q1_v, q3_v = np.percentile(v, [25, 75])
+        q1_v, q3_v = vs['q25'], vs['q75']
         iqr_v = q3_v - q1_v
         lower_v = q1_v - 1.5 * iqr_v
         upper_v = q3_v + 1.5 * iqr_v
-        outliers_v = np.sum((v < lower_v) | (v > upper_v))
+        outliers_v = np.count_nonzero((v < lower_v) | (v > upper_v))
         ax1.text(0.5, 0.95, f'Outliers: {outliers_v} ({outliers_v/len(v)*100:.1f}%)', 
                 transform=ax1.transAxes, fontsize=10, verticalalignment='top',
                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
@@ -722,26 +998,36 @@ class DatasetExplorer:
         ax2.set_title('Time Outlier Detection', fontsize=12, fontweight='bold')
         ax2.grid(True, alpha=0.3, axis='y')
         
-        q1_t, q3_t = np.percentile(t, [25, 75])
+        q1_t, q3_t = ts['q25'], ts['q75']
         iqr_t = q3_t - q1_t
         lower_t = q1_t - 1.5 * iqr_t
         upper_t = q3_t + 1.5 * iqr_t
-        outliers_t = np.sum((t < lower_t) | (t > upper_t))
+        outliers_t = np.count_nonzero((t < lower_t) | (t > upper_t))
         ax2.text(0.5, 0.95, f'Outliers: {outliers_t} ({outliers_t/len(t)*100:.1f}%)', 
                 transform=ax2.transAxes, fontsize=10, verticalalignment='top',
                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
         # 3. Z-score scatter plot
         ax3 = axes[1, 0]
-        z_v = (v - v.mean()) / v.std()
-        z_t = (t - t.mean()) / t.std()
+        z_v = (v - vs['mean']) / vs['std']
+        z_t = (t - ts['mean']) / ts['std']
         
         outlier_mask = (np.abs(z_v) > 3) | (np.abs(z_t) > 3)
         
-        ax3.scatter(z_v[~outlier_mask], z_t[~outlier_mask], alpha=0.5, s=20, 
-                   color='blue', label='Normal')
-        ax3.scatter(z_v[outlier_mask], z_t[outlier_mask], alpha=0.7, s=40, 
-                   color='red', label='Outliers (|z| > 3)')
+        # Every outlier is drawn; the normal cloud is subsampled, or binned
+        # with hexbin once it is large enough that density is what matters
+        z_v_normal = z_v[~outlier_mask]
+        z_t_normal = z_t[~outlier_mask]
+        if len(z_v_normal) <= HEXBIN_MIN_POINTS:
+            idx = _scatter_indices(len(z_v_normal))
+            # Single-color clouds: plot() stamps one marker path, unlike scatter()
+            ax3.plot(z_v_normal[idx], z_t_normal[idx], marker='o', linestyle='none', markersize=4.5,
+                     alpha=0.5, color='blue', label='Normal', rasterized=True)
+        else:
+            ax3.hexbin(z_v_normal, z_t_normal, gridsize=60, cmap='Blues', bins='log',
+                       mincnt=1, label='Normal')
+        ax3.plot(z_v[outlier_mask], z_t[outlier_mask], marker='o', linestyle='none', markersize=6.3,
+                 alpha=0.7, color='red', label='Outliers (|z| > 3)', rasterized=True)
         
         ax3.axhline(y=3, color='red', linestyle='--', alpha=0.5)
         ax3.axhline(y=-3, color='red', linestyle='--', alpha=0.5)
@@ -750,7 +1036,7 @@ class DatasetExplorer:
         
         ax3.set_xlabel('Voltage Z-Score', fontsize=12)
         ax3.set_ylabel('Time Z-Score', fontsize=12)
-        ax3.set_title(f'Z-Score Analysis ({np.sum(outlier_mask)} outliers)', 
+        ax3.set_title(f'Z-Score Analysis ({np.count_nonzero(outlier_mask)} outliers)', 
                      fontsize=12, fontweight='bold')
         ax3.legend()
         ax3.grid(True, alpha=0.3)
@@ -762,14 +1048,16 @@ class DatasetExplorer:
         R_guess = 50e6  # 1 GΩ
         C = 30e-12
         tau = R_guess * C
-        t_predicted = -tau * np.log(v / self.v_initial_guess) * 1e6
-        residuals = t - t_predicted
+        # classify_cycles already keeps only 0 < v < v_initial_guess, so the log is
+        # finite for every valid cycle and needs no extra mask or errstate guard
+        residuals, sigma = discharge_residuals(v, t, tau, self.v_initial_guess)
         
-        ax4.scatter(t, residuals, alpha=0.5, s=20, color='purple')
+        idx = _scatter_indices(len(t))
+        ax4.plot(t[idx], residuals[idx], marker='o', linestyle='none', markersize=4.5,
+                 alpha=0.5, color='purple', rasterized=True)
         ax4.axhline(y=0, color='red', linestyle='--', linewidth=2)
         
         # Add ±2σ bounds
-        sigma = residuals.std()
         ax4.axhline(y=2*sigma, color='orange', linestyle='--', alpha=0.5, label='±2σ')
         ax4.axhline(y=-2*sigma, color='orange', linestyle='--', alpha=0.5)
         
@@ -781,12 +1069,12 @@ class DatasetExplorer:
         ax4.grid(True, alpha=0.3)
         
         plt.suptitle('Outlier Analysis', fontsize=16, fontweight='bold', y=0.995)
-        plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            _save_figure(fig, save_path)
         
         # plt.show()
+        plt.close(fig)
 
 
 def parse_arguments():
@@ -842,14 +1130,75 @@ Examples:
         help='Skip generating individual plot files (only generate PDF report)'
     )
     
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Suppress per-file dataset loading messages'
+    )
+    
     return parser.parse_args()
 
 
 
+# Explorer used by _render_plot in a plot worker process, set once by _init_plot_worker
+_WORKER_EXPLORER = None
+
+
+def _init_plot_worker(explorer):
+    """Store the explorer in a plot worker process so tasks do not have to carry it."""
+    global _WORKER_EXPLORER
+    _WORKER_EXPLORER = explorer
+
+
+def _render_plot(method, kwargs, explorer=None):
+    """Draw one explorer plot into PNG bytes (explorer defaults to the worker's)."""
+    if explorer is None:
+        explorer = _WORKER_EXPLORER
+    buf = BytesIO()
+    getattr(explorer, method)(save_path=buf, **kwargs)
+    return buf.getvalue()
+
+
+def render_plots(explorer, jobs):
+    """
+    Draw several explorer plots, one worker process per plot when CPUs allow.
+    
+    Args:
+        explorer: DatasetExplorer instance with loaded data
+        jobs: Dict mapping an image key to (plot method name, keyword arguments)
+        
+    Returns:
+        Dict mapping each image key to a BytesIO buffer holding its PNG
+    """
+    # Fill the summary cache first so each worker receives it with the explorer
+    explorer._stats()
+    methods = [method for method, _ in jobs.values()]
+    kwargs = [kw for _, kw in jobs.values()]
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers > 1:
+        # Figures are independent; pyplot state is per process, so this is safe
+        sys.stdout.flush()
+        # The explorer goes to each worker once; tasks only carry the method and kwargs
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_plot_worker,
+                                 initargs=(explorer,)) as executor:
+            pngs = list(executor.map(_render_plot, methods, kwargs))
+    else:
+        pngs = [_render_plot(method, kw, explorer) for method, kw in zip(methods, kwargs)]
+    return {key: BytesIO(png) for key, png in zip(jobs, pngs)}
+
+
+def _image_available(image):
+    """Return True if a report image (PNG path or BytesIO buffer) has content."""
+    if isinstance(image, BytesIO):
+        return image.getbuffer().nbytes > 0
+    return os.path.exists(image)
+
+
 def generate_eda_report(explorer, output_path="eda_report.pdf", 
                         dataset_name="Neural Dataset Analysis",
                         r_guesses=None,
-                        dataset_path=None):
+                        dataset_path=None,
+                        precomputed_images=None):
     """
     Generate a comprehensive PDF report with all EDA plots and statistics.
     
@@ -859,6 +1208,9 @@ def generate_eda_report(explorer, output_path="eda_report.pdf",
         dataset_name: Name of the dataset for the report title
         r_guesses: List of resistance values for theoretical curves
         dataset_path: Path to the dataset file
+        precomputed_images: Optional dict mapping 'eda', 'theory', 'outlier' and
+            'multispike' to already-saved PNG paths or BytesIO buffers; those
+            plots are embedded as-is instead of being drawn again
     """
     if explorer.data is None:
         print("No data loaded in explorer. Cannot generate report.")
@@ -870,31 +1222,26 @@ def generate_eda_report(explorer, output_path="eda_report.pdf",
     if dataset_path is None:
         dataset_path = "unknown"
     
-    # Create temporary image files
-    temp_files = []
-    eda_path = "temp_eda.png"
-    theory_path = "temp_theory.png"
-    outlier_path = "temp_outlier.png"
-    multi_spike_path = "temp_multispike.png"
+    # Plots that were not supplied are rendered into in-memory PNG buffers that
+    # ReportLab reads directly, so nothing is written to (or cleaned up from) the disk
+    images = dict(precomputed_images or {})
     
     try:
-        # Generate all plots
-        print("Generating EDA plots...")
-        explorer.plot_comprehensive_eda(save_path=eda_path)
-        temp_files.append(eda_path)
-        
-        print("Generating theoretical curves...")
-        explorer.plot_theoretical_curves(save_path=theory_path, R_guesses=r_guesses)
-        temp_files.append(theory_path)
-        
-        print("Generating outlier analysis...")
-        explorer.plot_outlier_analysis(save_path=outlier_path)
-        temp_files.append(outlier_path)
-        
-        print("Multispike comparison plot...")
-        explorer.plot_multispike_comparison(save_path=multi_spike_path)
-        temp_files.append(multi_spike_path)
-    
+        # Generate any missing plots
+        jobs = {
+            'eda': ('plot_comprehensive_eda', {}),
+            'theory': ('plot_theoretical_curves', {'R_guesses': r_guesses}),
+            'outlier': ('plot_outlier_analysis', {}),
+            'multispike': ('plot_multispike_comparison', {}),
+        }
+        missing = {key: job for key, job in jobs.items() if key not in images}
+        if missing:
+            print(f"Generating {len(missing)} report plot(s)...")
+            images.update(render_plots(explorer, missing))
+        
+        for image in images.values():
+            if isinstance(image, BytesIO):
+                image.seek(0)
         
         # Create PDF
         print(f"Creating PDF report: {output_path}")
@@ -936,14 +1283,17 @@ def generate_eda_report(explorer, output_path="eda_report.pdf",
         # Executive Summary
         story.append(Paragraph("Executive Summary", heading_style))
         
+        stats = explorer._stats()
+        vs = stats['v_currents']
+        ts = stats['gt_times']
         summary_text = f"""
         This report presents a comprehensive exploratory data analysis of the neural dataset containing 
         {explorer.data['total_samples']} total samples with {explorer.data['valid_samples']} valid data points 
         ({explorer.data['valid_samples']/explorer.data['total_samples']*100:.1f}% validity rate).
         
         The dataset represents capacitor discharge measurements with voltage readings ranging from 
-        {explorer.data['v_currents'].min():.4f}V to {explorer.data['v_currents'].max():.4f}V and 
-        time measurements from {explorer.data['gt_times'].min():.1f}μs to {explorer.data['gt_times'].max():.1f}μs.
+        {vs['min']:.4f}V to {vs['max']:.4f}V and 
+        time measurements from {ts['min']:.1f}μs to {ts['max']:.1f}μs.
         
         Key findings include data quality assessment, voltage and time distributions, theoretical model 
         comparisons, and outlier identification to support subsequent modeling efforts.
@@ -955,7 +1305,8 @@ def generate_eda_report(explorer, output_path="eda_report.pdf",
         # Dataset Statistics
         story.append(Paragraph("Dataset Statistics", heading_style))
         
-        # Create statistics table as text
+        # Create statistics table as text from the cached summaries
+        cs = stats['cycle_lengths']
         stats_text = f"""
         <b>Sample Counts:</b><br/>
         • Total Samples: {explorer.data['total_samples']}<br/>
@@ -964,33 +1315,31 @@ def generate_eda_report(explorer, output_path="eda_report.pdf",
         • Validity Rate: {explorer.data['valid_samples']/explorer.data['total_samples']*100:.2f}%<br/><br/>
         
         <b>Voltage Statistics:</b><br/>
-        • Range: {explorer.data['v_currents'].min():.6f}V - {explorer.data['v_currents'].max():.6f}V<br/>
-        • Mean: {explorer.data['v_currents'].mean():.6f}V<br/>
-        • Median: {np.median(explorer.data['v_currents']):.6f}V<br/>
-        • Standard Deviation: {explorer.data['v_currents'].std():.6f}V<br/><br/>
+        • Range: {vs['min']:.6f}V - {vs['max']:.6f}V<br/>
+        • Mean: {vs['mean']:.6f}V<br/>
+        • Median: {vs['median']:.6f}V<br/>
+        • Standard Deviation: {vs['std']:.6f}V<br/><br/>
         
         <b>Spike time Statistics:</b><br/>
-        • Range: {explorer.data['gt_times'].min():.1f}μs - {explorer.data['gt_times'].max():.1f}μs<br/>
-        • Mean: {explorer.data['gt_times'].mean():.1f}μs<br/>
-        • Median: {np.median(explorer.data['gt_times']):.1f}μs<br/>
-        • Standard Deviation: {explorer.data['gt_times'].std():.1f}μs<br/><br/>
+        • Range: {ts['min']:.1f}μs - {ts['max']:.1f}μs<br/>
+        • Mean: {ts['mean']:.1f}μs<br/>
+        • Median: {ts['median']:.1f}μs<br/>
+        • Standard Deviation: {ts['std']:.1f}μs<br/><br/>
         
         <b>Cycle Statistics:</b><br/>
-        • Mean Cycle Length: {explorer.data['cycle_lengths'].mean():.2f}μs<br/>
-        • Median Cycle Length: {np.median(explorer.data['cycle_lengths']):.2f}μs<br/><br/>
-        • Max Cycle Length: {explorer.data['cycle_lengths'].max():.2f}μs<br/>
-        • Min Cycle Length: {explorer.data['cycle_lengths'].min():.2f}μs<br/>
+        • Mean Cycle Length: {cs['mean']:.2f}μs<br/>
+        • Median Cycle Length: {cs['median']:.2f}μs<br/><br/>
+        • Max Cycle Length: {cs['max']:.2f}μs<br/>
+        • Min Cycle Length: {cs['min']:.2f}μs<br/>
 
         <b>Data Quality Issues:</b><br/>
         """
         
         # Add invalid data breakdown
         if explorer.data['invalid_reasons']:
-            reasons_count = {}
-            for _, reason, _, _ in explorer.data['invalid_reasons']:
-                reasons_count[reason] = reasons_count.get(reason, 0) + 1
-            for reason, count in reasons_count.items():
-                stats_text += f"• {reason.replace('_', ' ').title()}: {count} samples<br/>"
+            reasons_count = Counter(reason for _, reason, _, _ in explorer.data['invalid_reasons'])
+            stats_text += ''.join(f"• {REASON_LABELS[reason]}: {count} samples<br/>"
+                                  for reason, count in reasons_count.items())
         else:
             stats_text += "• No data quality issues detected<br/>"
         
@@ -1006,8 +1355,9 @@ def generate_eda_report(explorer, output_path="eda_report.pdf",
         """, styles['Normal']))
         story.append(Spacer(1, 12))
         
-        if os.path.exists(eda_path):
-            story.append(Image(eda_path, width=7*inch, height=5.8*inch))
+        if _image_available(images['eda']):
+            # Fit the frame width without distorting the figure's aspect ratio
+            story.append(Image(images['eda'], width=doc.width, height=5.8*inch, kind='proportional'))
         story.append(PageBreak())
         
         # Theoretical Analysis
@@ -1019,8 +1369,8 @@ def generate_eda_report(explorer, output_path="eda_report.pdf",
         """, styles['Normal']))
         story.append(Spacer(1, 12))
         
-        if os.path.exists(theory_path):
-            story.append(Image(theory_path, width=7*inch, height=3.5*inch))
+        if _image_available(images['theory']):
+            story.append(Image(images['theory'], width=doc.width, height=3.5*inch, kind='proportional'))
         story.append(PageBreak())
         
         # Outlier Analysis
@@ -1032,33 +1382,33 @@ def generate_eda_report(explorer, output_path="eda_report.pdf",
         """, styles['Normal']))
         story.append(Spacer(1, 12))
         
-        if os.path.exists(outlier_path):
-            story.append(Image(outlier_path, width=7*inch, height=5*inch))
+        if _image_available(images['outlier']):
+            story.append(Image(images['outlier'], width=doc.width, height=5*inch, kind='proportional'))
         story.append(PageBreak())
         
         # Multi-Spike Comparison
-        if os.path.exists(multi_spike_path):
+        if _image_available(images['multispike']):
             story.append(Paragraph("Multi-Spike Cycle Comparison", heading_style))
             story.append(Paragraph("""
             Dedicated analysis comparing cycles with different spike counts (1, 2, and 3+ spikes). 
             This section highlights differences in voltage and time distributions across spike counts.
             """, styles['Normal']))
             story.append(Spacer(1, 12))
-            story.append(Image(multi_spike_path, width=7*inch, height=5*inch))
+            story.append(Image(images['multispike'], width=doc.width, height=5*inch, kind='proportional'))
             story.append(PageBreak())
         
         # Conclusions and Recommendations
         story.append(Paragraph("Conclusions and Recommendations", heading_style))
         
         v = explorer.data['v_currents']
-        t = explorer.data['gt_times']
-        outlier_percentage = len([x for x in (v - v.mean()) / v.std() if abs(x) > 3]) / len(v) * 100
+        # |z| > 3  <=>  |v - mean| > 3 * std, using the cached mean/std
+        outlier_percentage = np.count_nonzero(np.abs(v - vs['mean']) > 3 * vs['std']) / v.size * 100
         
         conclusions_text = f"""
         <b>Key Findings:</b><br/>
         1. Data quality is high with {explorer.data['valid_samples']/explorer.data['total_samples']*100:.1f}% valid samples<br/>
-        2. Voltage distribution shows mean={v.mean():.4f}V with relatively low variance<br/>
-        3. Time measurements span {t.max()-t.min():.0f}μs range with mean={t.mean():.1f}μs<br/>
+        2. Voltage distribution shows mean={vs['mean']:.4f}V with relatively low variance<br/>
+        3. Time measurements span {ts['max']-ts['min']:.0f}μs range with mean={ts['mean']:.1f}μs<br/>
         4. Outlier rate is approximately {outlier_percentage:.1f}% based on z-score analysis<br/><br/>
         
         <b>Recommendations for Modeling:</b><br/>
@@ -1082,21 +1432,13 @@ def generate_eda_report(explorer, output_path="eda_report.pdf",
         
     except Exception as e:
         print(f"Error generating PDF report: {str(e)}")
-        
-    finally:
-        # Clean up temporary files
-        for temp_file in temp_files:
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except Exception:
-                    pass
 
 def main():
     """Main execution function."""
     args = parse_arguments()
-    
-    # Validate input file exists
+    # Log to stdout so messages stay in order with the report's print output
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format='%(message)s', stream=sys.stdout)
     
     if args.input is None:
         print("Error: Input file must be specified with --input")
@@ -1106,12 +1448,6 @@ def main():
     if isinstance(args.input, str):
         args.input = [args.input]
     
-    # Validate all input files exist
-    for input_file in args.input:
-        if not os.path.exists(input_file):
-            print(f"Error: Input file '{input_file}' not found.")
-            return 1
-    
     # Generate default output filename if not specified
     if args.output is None:
         if len(args.input) == 1:
@@ -1159,25 +1495,25 @@ def main():
         dataset_display_path = f"{len(args.input)} combined files: {', '.join([os.path.basename(f) for f in args.input])}"
     
     if not args.no_plots:
-        # Create comprehensive EDA plots
-        print("\nGenerating EDA overview plot...")
-        explorer.plot_comprehensive_eda(save_path='eda_overview.png', dataset_path=dataset_display_path)
-        
-        # Plot theoretical curves with different R values
-        print("Generating theoretical curves plot...")
-        explorer.plot_theoretical_curves(
-            R_guesses=args.r_guesses,
-            save_path='theoretical_curves.png'
-        )
-        
-        # Analyze outliers
-        print("Generating outlier analysis plot...")
-        explorer.plot_outlier_analysis(save_path='outlier_analysis.png')
+        # EDA overview, theoretical curves, outlier analysis and multi-spike comparison
+        print("\nGenerating EDA plots...")
+        plot_files = {
+            'eda': ('eda_overview.png', 'plot_comprehensive_eda',
+                    {'dataset_path': dataset_display_path}),
+            'theory': ('theoretical_curves.png', 'plot_theoretical_curves',
+                       {'R_guesses': args.r_guesses}),
+            'outlier': ('outlier_analysis.png', 'plot_outlier_analysis', {}),
+            'multispike': ('multispike_comparison.png', 'plot_multispike_comparison', {}),
+        }
+        precomputed_images = render_plots(
+            explorer, {key: (method, kw) for key, (_, method, kw) in plot_files.items()})
         
-        # Multi-spike comparison
-        print("Generating multi-spike comparison plot...")
-        # Use first input file for multispike comparison (needs to re-load dataset)
-        explorer.plot_multispike_comparison(save_path='multispike_comparison.png', dataset_path=args.input[0] if len(args.input) == 1 else args.input)
+        # Keep the standalone PNGs, and embed the same buffers in the report
+        for key, (filename, _, _) in plot_files.items():
+            with open(filename, 'wb') as f:
+                f.write(precomputed_images[key].getbuffer())
+    else:
+        precomputed_images = None
     
     # Generate PDF report
     print(f"\nGenerating PDF report: {args.output}")
@@ -1186,7 +1522,8 @@ def main():
         args.output, 
         "Neural Spike Dataset Analysis",
         args.r_guesses,
-        dataset_display_path
+        dataset_display_path,
+        precomputed_images
     )
     
     print("\n" + "=" * 60)
@@ -1198,6 +1535,5 @@ def main():
 
 # Usage Example (kept for backwards compatibility)
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
 